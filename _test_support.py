@@ -0,0 +1,57 @@
+"""
+Shared helpers for the root-level test scripts.
+"""
+
+import contextlib
+import os
+import sys
+import traceback
+
+# Larger read buffer than the 8 KiB default for prompt/requirement files
+READ_BUFFER = 128 * 1024
+
+
+def read_text(path):
+    """Read a UTF-8 text file in one buffered read."""
+    with open(path, "rb", buffering=READ_BUFFER) as f:
+        return f.read().decode("utf-8")
+
+
+def print_exc(e):
+    """Full traceback when a human is watching stderr; a single line otherwise (CI)."""
+    if sys.stderr.isatty():
+        traceback.print_exc()
+    else:
+        print(f"   {type(e).__name__}: {e}", file=sys.stderr)
+
+
+def run_tests(tests):
+    """Run test functions in order; returns how many passed (an exception counts as a failure).
+
+    Sequential on purpose: concurrent tests interleave their printed reports
+    and share process-wide state such as sys.stdout and mock.patch targets.
+    """
+    passed = 0
+    for test in tests:
+        try:
+            ok = bool(test())
+        except Exception as e:
+            print(f"❌ Test {test.__name__} failed: {e}")
+            ok = False
+        passed += ok
+    return passed
+
+
+@contextlib.contextmanager
+def report_output():
+    """Where a script's printed report goes while the block runs.
+
+    QUIET=1 drops the report (the exit code still tells pass/fail); otherwise
+    stdout batches writes instead of flushing on every line.
+    """
+    if os.getenv("QUIET"):
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            yield
+    else:
+        sys.stdout.reconfigure(line_buffering=False)
+        yield
@@ -112,25 +112,21 @@ def demo_complete_workflow():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         csv_file = OUT_DIR / f"demo_export_{timestamp}.csv"
         
-        # Create CSV with quality scores
         import csv
-        with open(csv_file, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['Test ID', 'Title', 'Steps', 'Expected Result', 'Priority', 'Quality Score']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            # Create quality score mapping
-            quality_scores = {}
-            if quality_report and "individual_scores" in quality_report:
-                for score_info in quality_report["individual_scores"]:
-                    test_id = score_info.get("test_id", "")
-                    total_score = score_info.get("total_score", 0)
-                    quality_scores[test_id] = total_score
-            
+        
+        # Create quality score mapping
+        quality_scores = {}
+        if quality_report and "individual_scores" in quality_report:
+            for score_info in quality_report["individual_scores"]:
+                test_id = score_info.get("test_id", "")
+                total_score = score_info.get("total_score", 0)
+                quality_scores[test_id] = total_score
+        
+        def csv_rows():
             for case in test_cases:
                 steps = case.get("steps", [])
                 if isinstance(steps, list):
-                    steps_text = "\n".join(f"{i+1}. {step}" for i, step in enumerate(steps))
+                    steps_text = "\n".join([f"{i}. {step}" for i, step in enumerate(steps, 1)])
                 else:
                     steps_text = str(steps)
                 
@@ -138,14 +134,20 @@ def demo_complete_workflow():
                 quality_score = quality_scores.get(test_id, 0)
                 quality_display = f"{quality_score:.1f}/10" if quality_score > 0 else "N/A"
                 
-                writer.writerow({
-                    'Test ID': test_id,
-                    'Title': case.get("title", ""),
-                    'Steps': steps_text,
-                    'Expected Result': case.get("expected", ""),
-                    'Priority': case.get("priority", "Medium"),
-                    'Quality Score': quality_display
-                })
+                yield (
+                    test_id,
+                    case.get("title", ""),
+                    steps_text,
+                    case.get("expected", ""),
+                    case.get("priority", "Medium"),
+                    quality_display,
+                )
+        
+        # Create CSV with quality scores: one writerows call over the generator, through a 1 MiB file buffer
+        with open(csv_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['Test ID', 'Title', 'Steps', 'Expected Result', 'Priority', 'Quality Score'])
+            writer.writerows(csv_rows())
         
         print(f"✅ CSV export successful: {csv_file}")
         print(f"   File size: {csv_file.stat().st_size} bytes")
@@ -156,29 +158,48 @@ def demo_complete_workflow():
     # Step 6: Export to Excel
     print("\n📊 Step 6: Generating Excel export...")
     try:
-        import openpyxl
         from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.styles import Font, PatternFill, Alignment
         
         excel_file = OUT_DIR / f"demo_export_{timestamp}.xlsx"
         
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Test Cases"
+        # Write-only workbook: rows are streamed to the file as they are appended
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Test Cases")
+        
+        # Adjust column widths (must come before the first row in write-only mode)
+        ws.column_dimensions['A'].width = 12
+        ws.column_dimensions['B'].width = 30
+        ws.column_dimensions['C'].width = 50
+        ws.column_dimensions['D'].width = 30
+        ws.column_dimensions['E'].width = 10
+        ws.column_dimensions['F'].width = 15
         
         # Headers
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        header_alignment = Alignment(horizontal="center", vertical="center")
         headers = ['Test ID', 'Title', 'Steps', 'Expected Result', 'Priority', 'Quality Score']
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            cell.alignment = Alignment(horizontal="center", vertical="center")
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = header_alignment
+            header_cells.append(cell)
+        ws.append(header_cells)
         
         # Data rows with quality scores and formatting
-        for row, case in enumerate(test_cases, 2):
+        steps_alignment = Alignment(wrap_text=True, vertical="top")
+        quality_fills = {
+            color: PatternFill(start_color=color, end_color=color, fill_type="solid")
+            for color in ("90EE90", "FFE135", "FFB6C1")
+        }
+        for case in test_cases:
             steps = case.get("steps", [])
             if isinstance(steps, list):
-                steps_text = "\n".join(f"{i+1}. {step}" for i, step in enumerate(steps))
+                steps_text = "\n".join([f"{i}. {step}" for i, step in enumerate(steps, 1)])
             else:
                 steps_text = str(steps)
             
@@ -186,32 +207,27 @@ def demo_complete_workflow():
             quality_score = quality_scores.get(test_id, 0)
             quality_display = f"{quality_score:.1f}/10" if quality_score > 0 else "N/A"
             
-            ws.cell(row=row, column=1, value=test_id)
-            ws.cell(row=row, column=2, value=case.get("title", ""))
-            
-            steps_cell = ws.cell(row=row, column=3, value=steps_text)
-            steps_cell.alignment = Alignment(wrap_text=True, vertical="top")
-            
-            ws.cell(row=row, column=4, value=case.get("expected", ""))
+            steps_cell = WriteOnlyCell(ws, value=steps_text)
+            steps_cell.alignment = steps_alignment
             
-            priority_cell = ws.cell(row=row, column=5, value=case.get("priority", "Medium"))
-            quality_cell = ws.cell(row=row, column=6, value=quality_display)
+            quality_cell = WriteOnlyCell(ws, value=quality_display)
             
             # Color code quality scores
             if quality_score >= 8.0:
-                quality_cell.fill = PatternFill(start_color="90EE90", end_color="90EE90", fill_type="solid")
+                quality_cell.fill = quality_fills["90EE90"]
             elif quality_score >= 6.0:
-                quality_cell.fill = PatternFill(start_color="FFE135", end_color="FFE135", fill_type="solid")
+                quality_cell.fill = quality_fills["FFE135"]
             elif quality_score > 0:
-                quality_cell.fill = PatternFill(start_color="FFB6C1", end_color="FFB6C1", fill_type="solid")
-        
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 12
-        ws.column_dimensions['B'].width = 30
-        ws.column_dimensions['C'].width = 50
-        ws.column_dimensions['D'].width = 30
-        ws.column_dimensions['E'].width = 10
-        ws.column_dimensions['F'].width = 15
+                quality_cell.fill = quality_fills["FFB6C1"]
+            
+            ws.append([
+                test_id,
+                case.get("title", ""),
+                steps_cell,
+                case.get("expected", ""),
+                case.get("priority", "Medium"),
+                quality_cell,
+            ])
         
         wb.save(excel_file)
         
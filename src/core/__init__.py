@@ -7,19 +7,23 @@ Keep this file small: its purpose is purely convenience for teaching and
 to keep example agent files short and readable.
 """
 
-from .llm_client import chat
+from .llm_client import chat, achat, achat_stream
 from .utils import pick_requirement, parse_json_safely, to_rows, write_csv, write_json
-from .quality_scorer import score_test_cases, TestCaseQualityScorer
+from .quality_scorer import score_test_cases, score_test_cases_cached, score_test_cases_parallel, TestCaseQualityScorer
 from .requirement_enhancer import enhance_requirement, enhance_requirement_file, RequirementEnhancementAgent
 
 __all__ = [
     "chat",
+    "achat",
+    "achat_stream",
     "pick_requirement",
     "parse_json_safely",
     "to_rows",
     "write_csv",
     "write_json",
     "score_test_cases",
+    "score_test_cases_cached",
+    "score_test_cases_parallel",
     "TestCaseQualityScorer",
     "enhance_requirement",
     "enhance_requirement_file",
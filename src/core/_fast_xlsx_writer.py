@@ -0,0 +1,281 @@
+"""
+Minimal direct-XML XLSX writer (internal).
+
+Writes a workbook straight into the ZIP container: the fixed package parts
+are literal bytes and each sheet's XML is streamed row by row with inline
+strings, so no cell objects, shared-string table or style deduplication are
+involved. Only the handful of styles used by the test case exports are
+available (see the `STYLE_*` ids below).
+
+`write_xlsx` writes one sheet; `write_xlsx_sheets` takes several `XlsxSheet`
+specs (the UI's large-export path uses it for its three sheets).
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import zipfile
+from pathlib import Path
+from typing import Any, Iterable, List, Mapping, NamedTuple, Optional, Sequence
+
+# Cell style ids (indexes into the cellXfs table of _STYLES_XML)
+STYLE_DEFAULT = 0
+STYLE_HEADER = 1
+STYLE_WRAP = 2
+STYLE_GREEN = 3
+STYLE_YELLOW = 4
+STYLE_PINK = 5
+STYLE_GRAY = 6
+STYLE_DETAILS_HEADER = 7
+STYLE_BOLD = 8
+STYLE_SECTION = 9
+
+# Fill colour -> style id
+FILL_STYLES = {"90EE90": STYLE_GREEN, "FFE135": STYLE_YELLOW, "FFB6C1": STYLE_PINK, "D3D3D3": STYLE_GRAY}
+
+
+class XlsxSheet(NamedTuple):
+    """One sheet for `write_xlsx_sheets`; empty `headers` means no header row."""
+    name: str
+    headers: Sequence[str]
+    rows: Iterable[Sequence[Any]]
+    widths: Sequence[float] = ()
+    column_styles: Optional[Mapping[int, int]] = None
+    header_style: int = STYLE_HEADER
+
+
+_CONTENT_TYPES_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+)
+_CONTENT_TYPES_SHEET = (
+    '<Override PartName="/xl/worksheets/sheet{n}.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+)
+_CONTENT_TYPES_TAIL = (
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+
+_ROOT_RELS_XML = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    b'<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    b'</Relationships>'
+)
+
+_RELS_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+)
+_WORKBOOK_REL = (
+    '<Relationship Id="rId{n}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/{kind}" Target="{target}"/>'
+)
+
+# fills 0/1 are the gray125 defaults Excel requires; xfs follow the STYLE_* ids
+_STYLES_XML = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    b'<fonts count="4">'
+    b'<font><sz val="11"/><name val="Calibri"/></font>'
+    b'<font><b/><sz val="11"/><color rgb="FFFFFFFF"/><name val="Calibri"/></font>'
+    b'<font><b/><sz val="11"/><name val="Calibri"/></font>'
+    b'<font><b/><sz val="12"/><name val="Calibri"/></font>'
+    b'</fonts>'
+    b'<fills count="8">'
+    b'<fill><patternFill patternType="none"/></fill>'
+    b'<fill><patternFill patternType="gray125"/></fill>'
+    b'<fill><patternFill patternType="solid"><fgColor rgb="FF366092"/><bgColor rgb="FF366092"/></patternFill></fill>'
+    b'<fill><patternFill patternType="solid"><fgColor rgb="FF90EE90"/><bgColor rgb="FF90EE90"/></patternFill></fill>'
+    b'<fill><patternFill patternType="solid"><fgColor rgb="FFFFE135"/><bgColor rgb="FFFFE135"/></patternFill></fill>'
+    b'<fill><patternFill patternType="solid"><fgColor rgb="FFFFB6C1"/><bgColor rgb="FFFFB6C1"/></patternFill></fill>'
+    b'<fill><patternFill patternType="solid"><fgColor rgb="FFD3D3D3"/><bgColor rgb="FFD3D3D3"/></patternFill></fill>'
+    b'<fill><patternFill patternType="solid"><fgColor rgb="FF4F81BD"/><bgColor rgb="FF4F81BD"/></patternFill></fill>'
+    b'</fills>'
+    b'<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    b'<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    b'<cellXfs count="10">'
+    b'<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    b'<xf numFmtId="0" fontId="1" fillId="2" borderId="0" xfId="0" applyFont="1" applyFill="1" applyAlignment="1">'
+    b'<alignment horizontal="center" vertical="center"/></xf>'
+    b'<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0" applyAlignment="1">'
+    b'<alignment vertical="top" wrapText="1"/></xf>'
+    b'<xf numFmtId="0" fontId="0" fillId="3" borderId="0" xfId="0" applyFill="1"/>'
+    b'<xf numFmtId="0" fontId="0" fillId="4" borderId="0" xfId="0" applyFill="1"/>'
+    b'<xf numFmtId="0" fontId="0" fillId="5" borderId="0" xfId="0" applyFill="1"/>'
+    b'<xf numFmtId="0" fontId="0" fillId="6" borderId="0" xfId="0" applyFill="1"/>'
+    b'<xf numFmtId="0" fontId="1" fillId="7" borderId="0" xfId="0" applyFont="1" applyFill="1" applyAlignment="1">'
+    b'<alignment horizontal="center" vertical="center"/></xf>'
+    b'<xf numFmtId="0" fontId="2" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    b'<xf numFmtId="0" fontId="3" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    b'</cellXfs>'
+    b'<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    b'</styleSheet>'
+)
+
+# One str.translate pass per string; "\r" is escaped so XML end-of-line handling keeps it
+_XML_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "\r": "&#13;"})
+# Control characters XML 1.0 forbids (same set as openpyxl's ILLEGAL_CHARACTERS_RE); stripped
+_ILLEGAL_XML_CHARS = re.compile(r"[\000-\010\013\014\016-\037]")
+_COLUMN_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _column_letter(index: int) -> str:
+    """0-based column index -> Excel column letters (0 -> "A", 26 -> "AA")."""
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = _COLUMN_LETTERS[rem] + letters
+    return letters
+
+
+def _cell_xml(ref: str, value: Any, style: int) -> str:
+    """One <c> element; strings are written inline, finite numbers as <v>."""
+    s_attr = f' s="{style}"' if style else ""
+    if isinstance(value, int) and not isinstance(value, bool) or isinstance(value, float) and math.isfinite(value):
+        return f'<c r="{ref}"{s_attr}><v>{value}</v></c>'
+    # nan/inf have no numeric cell form, so they fall through and are written as text
+    text = _ILLEGAL_XML_CHARS.sub("", str(value)).translate(_XML_ESCAPES)
+    return f'<c r="{ref}"{s_attr} t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _write_sheet(raw, sheet: XlsxSheet) -> int:
+    """Stream one worksheet part into the open zip member `raw`; returns its data row count."""
+    headers, widths = sheet.headers, sheet.widths
+    column_styles = sheet.column_styles or {}
+    letters = [_column_letter(i) for i in range(max(len(headers), len(widths)))]
+
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    ]
+    if widths:
+        parts.append("<cols>")
+        for i, w in enumerate(widths):
+            style = column_styles.get(i)
+            s_attr = f' style="{style}"' if style else ""
+            parts.append(f'<col min="{i + 1}" max="{i + 1}" width="{w}"{s_attr} customWidth="1"/>')
+        parts.append("</cols>")
+    parts.append("<sheetData>")
+    if headers:
+        parts.append('<row r="1">')
+        parts.extend(
+            _cell_xml(f"{letters[i]}1", header, sheet.header_style) for i, header in enumerate(headers)
+        )
+        parts.append("</row>")
+    raw.write("".join(parts).encode("utf-8"))
+
+    first = 2 if headers else 1
+    count = 0
+    for count, row in enumerate(sheet.rows, 1):
+        r = count + first - 1
+        cells = [f'<row r="{r}">']
+        for i, value in enumerate(row):
+            if i >= len(letters):
+                letters.append(_column_letter(i))
+            if isinstance(value, tuple):
+                value, style = value
+            else:
+                style = column_styles.get(i, STYLE_DEFAULT)
+            if value is not None and value != "":
+                cells.append(_cell_xml(f"{letters[i]}{r}", value, style))
+        cells.append("</row>")
+        raw.write("".join(cells).encode("utf-8"))
+
+    raw.write(b"</sheetData></worksheet>")
+    return count
+
+
+def write_xlsx_sheets(
+    path: str | Path,
+    sheets: Sequence[XlsxSheet],
+    compresslevel: int | None = None,
+) -> List[int]:
+    """
+    Write each of `sheets` (in order) to one XLSX file at `path`.
+
+    Rows follow the `write_xlsx` conventions: a cell may be a
+    `(value, style_id)` pair, otherwise it gets the sheet's column style, and
+    `None` or "" leaves the cell empty. Returns the data row count of each sheet.
+    """
+    n = len(sheets)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zf:
+        zf.writestr(
+            "[Content_Types].xml",
+            _CONTENT_TYPES_HEAD
+            + "".join(_CONTENT_TYPES_SHEET.format(n=i) for i in range(1, n + 1))
+            + _CONTENT_TYPES_TAIL,
+        )
+        zf.writestr("_rels/.rels", _ROOT_RELS_XML)
+        zf.writestr(
+            "xl/workbook.xml",
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><sheets>'
+            + "".join(
+                f'<sheet name="{sheet.name.translate(_XML_ESCAPES)}" sheetId="{i}" r:id="rId{i}"/>'
+                for i, sheet in enumerate(sheets, 1)
+            )
+            + "</sheets></workbook>",
+        )
+        zf.writestr(
+            "xl/_rels/workbook.xml.rels",
+            _RELS_HEAD
+            + "".join(
+                _WORKBOOK_REL.format(n=i, kind="worksheet", target=f"worksheets/sheet{i}.xml")
+                for i in range(1, n + 1)
+            )
+            + _WORKBOOK_REL.format(n=n + 1, kind="styles", target="styles.xml")
+            + "</Relationships>",
+        )
+        zf.writestr("xl/styles.xml", _STYLES_XML)
+
+        counts = []
+        for i, sheet in enumerate(sheets, 1):
+            with zf.open(f"xl/worksheets/sheet{i}.xml", "w", force_zip64=True) as raw:
+                counts.append(_write_sheet(raw, sheet))
+    return counts
+
+
+def write_xlsx(
+    path: str | Path,
+    headers: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    sheet_name: str = "Sheet1",
+    widths: Sequence[float] = (),
+    column_styles: Mapping[int, int] | None = None,
+    compresslevel: int | None = None,
+) -> int:
+    """
+    Write `headers` plus `rows` to a single-sheet XLSX file at `path`.
+
+    Each row is a sequence of cell values; a cell may also be a
+    `(value, style_id)` pair to pick one of the `STYLE_*` ids. Cells without
+    an explicit style get `column_styles[col]` (default style otherwise),
+    which is also set as the column style so cells added later in Excel match.
+    `None` and "" values leave the cell empty. Returns the number of data rows.
+    """
+    sheet = XlsxSheet(sheet_name, headers, rows, widths, column_styles)
+    return write_xlsx_sheets(path, [sheet], compresslevel=compresslevel)[0]
+
+
+__all__ = [
+    "write_xlsx",
+    "write_xlsx_sheets",
+    "XlsxSheet",
+    "FILL_STYLES",
+    "STYLE_DEFAULT",
+    "STYLE_HEADER",
+    "STYLE_WRAP",
+    "STYLE_GREEN",
+    "STYLE_YELLOW",
+    "STYLE_PINK",
+    "STYLE_GRAY",
+    "STYLE_DETAILS_HEADER",
+    "STYLE_BOLD",
+    "STYLE_SECTION",
+]
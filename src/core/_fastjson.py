@@ -0,0 +1,36 @@
+"""
+Fast JSON helpers (internal).
+
+Uses `orjson` when it is installed and falls back to the standard library
+`json` module otherwise. Both paths return `str` from `dumps` so callers do
+not need to care which backend is active.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional dependency
+    _orjson = None
+
+import json as _json
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> str:
+    """Serialize `obj` to a compact JSON string."""
+    if _orjson is not None:
+        option = _orjson.OPT_SORT_KEYS if sort_keys else 0
+        return _orjson.dumps(obj, option=option).decode("utf-8")
+    return _json.dumps(obj, sort_keys=sort_keys, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document from `str` or `bytes`."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return _json.loads(data)
+
+
+__all__ = ["dumps", "loads"]
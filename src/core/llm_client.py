@@ -36,11 +36,36 @@ out = chat(messages)
 The function returns the assistant's text (string). For JSON outputs the
 caller should validate/parse the returned text (see `src.core.utils` helpers
 for parsing and cleanup).
+
+JSON mode: pass `response_format={"type": "json_object"}` to ask the provider
+for native JSON output (OpenAI `response_format`, Ollama `format="json"`).
+In that mode `chat` returns the parsed object (usually a dict) instead of text:
+
+```py
+data = chat(messages, response_format={"type": "json_object"})
+```
+
+`achat` is the asyncio counterpart (same arguments), for callers that want
+to overlap the LLM round-trip with other work:
+
+```py
+out = await achat(messages)
+```
+
+`achat_stream` yields the assistant text in chunks as the provider produces
+them, so callers can start work before the response is complete:
+
+```py
+async for chunk in achat_stream(messages):
+    buf.write(chunk)
+```
 """
 
 from __future__ import annotations
+import json
 import os
-from typing import List, Dict
+import time
+from typing import Any, AsyncIterator, List, Dict, Optional, Union
 import httpx
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
@@ -84,26 +109,34 @@ def _to_lc_messages(messages: List[Message]):
             lc_msgs.append(HumanMessage(content=content))
     return lc_msgs
 
-def _make_llm():
+def _make_llm(response_format: Optional[Dict[str, Any]] = None):
     """
     Create the LangChain chat model according to PROVIDER/MODEL envs.
 
     Note: We do NOT pass a `timeout` kwarg here for maximum compatibility
     across LangChain versions/backends (e.g., ChatOllama often has no such arg).
+
+    When `response_format` is given, the provider's native JSON mode is enabled.
     """
     if PROVIDER == "ollama":
         # LangChain's Ollama wrapper reads OLLAMA_HOST from env.
         os.environ["OLLAMA_HOST"] = OLLAMA_HOST
+        if response_format:
+            return ChatOllama(model=MODEL, format="json")
         return ChatOllama(model=MODEL)
     elif PROVIDER == "openai":
         if not OPENAI_API_KEY:
             raise RuntimeError("OPENAI_API_KEY is missing but PROVIDER=openai.")
         # Keep temperature=0 for deterministic teaching runs
-        return ChatOpenAI(model=MODEL, temperature=0)
+        llm = ChatOpenAI(model=MODEL, temperature=0)
+        if response_format:
+            return llm.bind(response_format=response_format)
+        return llm
     else:
         raise NotImplementedError("Unsupported PROVIDER. Use 'ollama' or 'openai'.")
 
-def chat(messages: List[Message], timeout: int = TIMEOUT_S) -> str:
+def _log_start(messages: List[Message]) -> None:
+    """Progress line for the start of a call (shared by chat/achat)."""
     if not isinstance(messages, list) or not messages:
         raise ValueError("messages must be a non-empty list of {'role','content'} dicts.")
 
@@ -130,23 +163,82 @@ def chat(messages: List[Message], timeout: int = TIMEOUT_S) -> str:
             size_info,
         )
 
+def _finish(resp: Any, t0: float, response_format: Optional[Dict[str, Any]]) -> Union[str, Any]:
+    """Extract the assistant text (or parsed JSON) and log completion."""
+    out = getattr(resp, "content", "") or ""
+    dt = time.perf_counter() - t0
+    if LLM_LOG:
+        logger.info("[LLM] ✔ done in %.2fs", dt)
+    if LLM_DEBUG:
+        logger.debug("[LLM] response length=%d", len(out))
+    if response_format:
+        # JSON mode: the provider guarantees a JSON document, parse it once here
+        return json.loads(out)
+    return out
+
+def chat(
+    messages: List[Message],
+    timeout: int = TIMEOUT_S,
+    response_format: Optional[Dict[str, Any]] = None,
+) -> Union[str, Any]:
+    _log_start(messages)
+
     # ---- call model
-    import time
     t0 = time.perf_counter()
-    llm = _make_llm()
+    llm = _make_llm(response_format)
     lc_msgs = _to_lc_messages(messages)
 
     try:
-        resp = llm.invoke(lc_msgs)
-        out = getattr(resp, "content", "") or ""
-        dt = time.perf_counter() - t0
-        if LLM_LOG:
-            logger.info("[LLM] ✔ done in %.2fs", dt)
-        if LLM_DEBUG:
-            logger.debug("[LLM] response length=%d", len(out))
-        return out
+        return _finish(llm.invoke(lc_msgs), t0, response_format)
     except Exception as e:
         dt = time.perf_counter() - t0
         # log exception with stacktrace
         logger.exception("[LLM] ✖ error after %.2fs: %s", dt, type(e).__name__)
         raise
+
+async def achat(
+    messages: List[Message],
+    timeout: int = TIMEOUT_S,
+    response_format: Optional[Dict[str, Any]] = None,
+) -> Union[str, Any]:
+    """Async `chat`: same arguments and return value, awaits the provider's `ainvoke`."""
+    _log_start(messages)
+
+    t0 = time.perf_counter()
+    llm = _make_llm(response_format)
+    lc_msgs = _to_lc_messages(messages)
+
+    try:
+        return _finish(await llm.ainvoke(lc_msgs), t0, response_format)
+    except Exception as e:
+        dt = time.perf_counter() - t0
+        logger.exception("[LLM] ✖ error after %.2fs: %s", dt, type(e).__name__)
+        raise
+
+async def achat_stream(
+    messages: List[Message],
+    timeout: int = TIMEOUT_S,
+) -> AsyncIterator[str]:
+    """Streaming `achat`: yields assistant text chunks via the provider's `astream`."""
+    _log_start(messages)
+
+    t0 = time.perf_counter()
+    llm = _make_llm()
+    lc_msgs = _to_lc_messages(messages)
+
+    n_chars = 0
+    try:
+        async for chunk in llm.astream(lc_msgs):
+            text = getattr(chunk, "content", "") or ""
+            if text:
+                n_chars += len(text)
+                yield text
+    except Exception as e:
+        dt = time.perf_counter() - t0
+        logger.exception("[LLM] ✖ error after %.2fs: %s", dt, type(e).__name__)
+        raise
+
+    if LLM_LOG:
+        logger.info("[LLM] ✔ done in %.2fs", time.perf_counter() - t0)
+    if LLM_DEBUG:
+        logger.debug("[LLM] response length=%d", n_chars)
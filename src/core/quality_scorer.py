@@ -6,7 +6,11 @@ This module provides AI-powered quality assessment for generated test cases.
 It evaluates various quality metrics and provides actionable insights.
 """
 
+import hashlib
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import List, Dict, Any, Tuple
 from pathlib import Path
 import re
@@ -14,9 +18,20 @@ import json
 
 from .llm_client import chat
 from .utils import write_json
+from . import _fastjson
 
 logger = logging.getLogger(__name__)
 
+# On-disk memo for score_test_cases_cached(); bump the version whenever the
+# scoring prompt or model changes so stale assessments are ignored.
+QUALITY_CACHE_VERSION = "v1"
+QUALITY_CACHE_DIR = Path(os.getenv("QUALITY_CACHE_DIR") or Path.home() / ".cache" / "testgen" / "quality")
+
+# score_test_cases_parallel(): cases per LLM call and concurrent calls
+# (lower QUALITY_CONCURRENCY for rate-limited API tiers)
+QUALITY_BATCH_SIZE = int(os.getenv("QUALITY_BATCH_SIZE") or "5")
+QUALITY_CONCURRENCY = int(os.getenv("QUALITY_CONCURRENCY") or "8")
+
 # Quality scoring prompts
 QUALITY_SYSTEM_PROMPT = """You are an expert QA quality assessor. Evaluate test cases based on industry best practices and provide detailed scoring with actionable feedback.
 
@@ -66,6 +81,27 @@ TEST CASES:
 
 Provide detailed quality scoring and actionable improvement suggestions."""
 
+# Appended to the user prompt of each score_test_cases_parallel() batch: the
+# batch is only a slice of the suite, so suite-level insights come from
+# QUALITY_SUITE_SYSTEM_PROMPT instead
+QUALITY_BATCH_NOTE = """
+
+These {batch_size} test cases are one batch of a {suite_size}-case suite. Score each case on its own merits; leave "quality_insights" empty, since coverage gaps are judged on the whole suite separately."""
+
+QUALITY_SUITE_SYSTEM_PROMPT = """You are an expert QA quality assessor. Evaluate a test suite as a whole against its requirement: which scenarios it covers, which it misses, and how to improve it. Do not score individual test cases.
+
+Return your assessment as JSON with this exact structure:
+{
+  "quality_insights": {
+    "coverage_gaps": ["Error handling scenarios", "Performance edge cases"],
+    "missing_categories": ["Security tests", "Integration tests"],
+    "recommendations": ["Add boundary value analysis", "Include negative test scenarios"],
+    "strengths": ["Good happy path coverage", "Clear test descriptions"],
+    "overall_feedback": "Test suite covers basic functionality well but needs more comprehensive error handling and edge case coverage."
+  }
+}
+"""
+
 
 class TestCaseQualityScorer:
     """Evaluates test case quality using AI-powered analysis."""
@@ -74,13 +110,16 @@ class TestCaseQualityScorer:
         self.output_dir = output_dir or Path("outputs/quality_reports")
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-    def score_test_cases(self, test_cases: List[Dict], requirement_text: str) -> Dict[str, Any]:
+    def score_test_cases(self, test_cases: List[Dict], requirement_text: str,
+                         save_report: bool = True, suite_size: int = None) -> Dict[str, Any]:
         """
         Score test cases for quality and provide improvement suggestions.
         
         Args:
             test_cases: List of test case dictionaries
             requirement_text: Original requirement text
+            save_report: Write quality_assessment.json (off for partial batches)
+            suite_size: Size of the whole suite when `test_cases` is one batch of it
             
         Returns:
             Quality assessment dictionary with scores and suggestions
@@ -93,6 +132,8 @@ class TestCaseQualityScorer:
                 requirement_text=requirement_text,
                 test_cases_json=json.dumps(test_cases, indent=2)
             )
+            if suite_size:
+                user_prompt += QUALITY_BATCH_NOTE.format(batch_size=len(test_cases), suite_size=suite_size)
             
             messages = [
                 {"role": "system", "content": QUALITY_SYSTEM_PROMPT},
@@ -114,9 +155,10 @@ class TestCaseQualityScorer:
             }
             
             # Save detailed report
-            report_file = self.output_dir / "quality_assessment.json"
-            write_json(quality_report, report_file)
-            logger.info(f"📊 Quality report saved to {report_file}")
+            if save_report:
+                report_file = self.output_dir / "quality_assessment.json"
+                write_json(quality_report, report_file)
+                logger.info(f"📊 Quality report saved to {report_file}")
             
             # Log summary
             overall_score = quality_report.get("overall_score", 0)
@@ -128,6 +170,32 @@ class TestCaseQualityScorer:
             logger.error(f"❌ Quality assessment failed: {e}")
             return self._get_fallback_quality_report(test_cases)
     
+    def assess_suite(self, test_cases: List[Dict], requirement_text: str) -> Dict[str, Any]:
+        """
+        Suite-level quality insights (coverage gaps, missing categories,
+        feedback) for all of `test_cases`, without per-case scores.
+        
+        Returns:
+            The quality_insights dictionary, or {} if the LLM call or parse failed
+        """
+        try:
+            user_prompt = QUALITY_USER_TEMPLATE.format(
+                requirement_text=requirement_text,
+                test_cases_json=json.dumps(test_cases, indent=2)
+            )
+            messages = [
+                {"role": "system", "content": QUALITY_SUITE_SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt}
+            ]
+            logger.info("📡 Calling LLM for suite-level quality insights...")
+            report = self._parse_quality_response(chat(messages))
+            if "assessment_note" in report:
+                return {}
+            return report.get("quality_insights") or {}
+        except Exception as e:
+            logger.error(f"❌ Suite quality insights failed: {e}")
+            return {}
+    
     def _parse_quality_response(self, raw_response: str) -> Dict[str, Any]:
         """Parse LLM response into structured quality report."""
         try:
@@ -186,7 +254,9 @@ class TestCaseQualityScorer:
                 "recommendations": ["Run full quality assessment", "Review test coverage"],
                 "strengths": ["Basic test structure"],
                 "overall_feedback": "Basic quality assessment completed. For detailed analysis, ensure LLM service is available."
-            }
+            },
+            # Marks a heuristic report (LLM unavailable or unparseable), same key as the UI's fallback
+            "assessment_note": "Fallback assessment - AI quality scoring was unavailable"
         }
     
     def _score_clarity(self, test_case: Dict) -> float:
@@ -324,4 +394,149 @@ def score_test_cases(test_cases: List[Dict], requirement_text: str,
         Quality assessment dictionary
     """
     scorer = TestCaseQualityScorer(output_dir)
-    return scorer.score_test_cases(test_cases, requirement_text)
\ No newline at end of file
+    return scorer.score_test_cases(test_cases, requirement_text)
+
+
+def _is_llm_assessment(quality_report: Dict[str, Any]) -> bool:
+    """True for a parsed LLM assessment with scores; False for fallback or empty reports."""
+    return "assessment_note" not in quality_report and bool(quality_report.get("individual_scores"))
+
+
+def score_test_cases_cached(test_cases: List[Dict], requirement_text: str,
+                            output_dir: Path = None, cache_dir: Path = None) -> Dict[str, Any]:
+    """
+    Same as score_test_cases, memoized on disk by a hash of the inputs.
+    
+    Only LLM assessments are cached; heuristic fallback reports (LLM
+    unavailable or reply not parseable) are recomputed on the next call.
+    
+    Args:
+        test_cases: List of test case dictionaries
+        requirement_text: Original requirement text
+        output_dir: Directory to save quality reports
+        cache_dir: Cache directory (default: QUALITY_CACHE_DIR)
+        
+    Returns:
+        Quality assessment dictionary
+    """
+    key_src = _fastjson.dumps([QUALITY_CACHE_VERSION, test_cases, requirement_text], sort_keys=True)
+    key = hashlib.sha256(key_src.encode("utf-8")).hexdigest()
+    cache_file = (cache_dir or QUALITY_CACHE_DIR) / f"{key}.json"
+    
+    try:
+        cached = _fastjson.loads(cache_file.read_bytes())
+        logger.info(f"📦 Quality assessment served from cache: {cache_file}")
+        return cached
+    except (OSError, ValueError):
+        pass
+    
+    quality_report = score_test_cases(test_cases, requirement_text, output_dir)
+    if _is_llm_assessment(quality_report):
+        try:
+            write_json(quality_report, cache_file)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write quality cache {cache_file}: {e}")
+    return quality_report
+
+
+def _intersect_quality_insights(reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Insights every batch agrees on: a gap one batch reports may be covered by another."""
+    insight_lists = [report.get("quality_insights", {}) for report in reports if _is_llm_assessment(report)]
+    quality_insights: Dict[str, Any] = {}
+    feedback = []
+    for insights in insight_lists:
+        value = insights.get("overall_feedback")
+        if value and value not in feedback:
+            feedback.append(value)
+    if insight_lists:
+        for key, value in insight_lists[0].items():
+            if isinstance(value, list):
+                quality_insights[key] = [
+                    item for item in value if all(item in other.get(key, []) for other in insight_lists[1:])
+                ]
+    quality_insights["overall_feedback"] = " ".join(feedback)
+    return quality_insights
+
+
+def _merge_quality_reports(reports: List[Dict[str, Any]], test_cases: List[Dict],
+                           requirement_text: str, quality_insights: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Combine per-batch quality reports into one report for all cases.
+    
+    `quality_insights` is the whole-suite assessment; without one, only the
+    insights shared by every batch are kept.
+    """
+    individual_scores = [score for report in reports for score in report.get("individual_scores", [])]
+    if individual_scores:
+        overall_score = sum(score.get("total_score", 0) for score in individual_scores) / len(individual_scores)
+    else:
+        overall_score = sum(report.get("overall_score", 0) for report in reports) / len(reports)
+    
+    if not quality_insights:
+        quality_insights = _intersect_quality_insights(reports)
+    
+    merged_report = {
+        "overall_score": round(overall_score, 1),
+        "individual_scores": individual_scores,
+        "quality_insights": quality_insights,
+    }
+    failed = sum(1 for report in reports if not _is_llm_assessment(report))
+    if failed:
+        merged_report["assessment_note"] = (
+            f"Partial fallback assessment - AI quality scoring was unavailable for {failed} of {len(reports)} batches"
+        )
+    else:
+        merged_report["metadata"] = {
+            "total_test_cases": len(test_cases),
+            "requirement_length": len(requirement_text),
+            "assessment_timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "batches": len(reports),
+        }
+    return merged_report
+
+
+def score_test_cases_parallel(test_cases: List[Dict], requirement_text: str,
+                              output_dir: Path = None, batch_size: int = None,
+                              max_workers: int = None) -> Dict[str, Any]:
+    """
+    Score test cases in batches of `batch_size`, with up to `max_workers`
+    LLM calls in flight, and merge the results into one report.
+    
+    Batches only produce the per-case scores; the suite-level insights
+    (coverage gaps, missing categories, feedback) come from one extra call
+    that sees every case, run alongside the batches.
+    
+    Small suites (one batch) go through score_test_cases unchanged.
+    
+    Args:
+        test_cases: List of test case dictionaries
+        requirement_text: Original requirement text
+        output_dir: Directory to save quality reports
+        batch_size: Cases per LLM call (default: QUALITY_BATCH_SIZE)
+        max_workers: Concurrent LLM calls (default: QUALITY_CONCURRENCY)
+        
+    Returns:
+        Quality assessment dictionary
+    """
+    batch_size = max(1, batch_size or QUALITY_BATCH_SIZE)
+    if len(test_cases) <= batch_size:
+        return score_test_cases(test_cases, requirement_text, output_dir)
+    
+    scorer = TestCaseQualityScorer(output_dir)
+    batches = [test_cases[i:i + batch_size] for i in range(0, len(test_cases), batch_size)]
+    workers = min(len(batches), max(1, max_workers or QUALITY_CONCURRENCY))
+    logger.info(f"🔍 Scoring {len(test_cases)} test cases in {len(batches)} batches ({workers} concurrent)")
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        suite_future = ex.submit(scorer.assess_suite, test_cases, requirement_text)
+        reports = list(ex.map(
+            lambda batch: scorer.score_test_cases(batch, requirement_text, save_report=False, suite_size=len(test_cases)),
+            batches,
+        ))
+        quality_insights = suite_future.result()
+    if not quality_insights:
+        logger.warning("⚠️ Suite-level insights unavailable, keeping only those shared by every batch")
+    
+    quality_report = _merge_quality_reports(reports, test_cases, requirement_text, quality_insights)
+    report_file = scorer.output_dir / "quality_assessment.json"
+    write_json(quality_report, report_file)
+    logger.info(f"📊 Merged quality report saved to {report_file}")
+    return quality_report
@@ -23,6 +23,8 @@ from pathlib import Path
 from typing import List, Dict
 import requests
 
+from . import _fastjson
+
 
 def pick_requirement(path_arg: str | None, req_dir: Path) -> Path:
     """Return a Path to a requirement `.txt` file.
@@ -58,7 +60,7 @@ def parse_json_safely(text: str, raw_path: Path) -> List[Dict]:
 
     This helper:
     1. Writes the raw LLM output to `raw_path` for debugging.
-    2. Attempts `json.loads` directly.
+    2. Attempts a direct parse (`orjson` when installed, else `json`).
     3. If that fails, does a minimal cleanup (strip, remove Markdown code
        fences and optional language header) and retries parsing.
     4. Ensures the top-level JSON is a list (expected: list of case dicts).
@@ -75,10 +77,10 @@ def parse_json_safely(text: str, raw_path: Path) -> List[Dict]:
         json.JSONDecodeError: If JSON parsing fails despite cleanup.
     """
     raw_path.parent.mkdir(parents=True, exist_ok=True)
-    raw_path.write_text(text, encoding="utf-8")
+    raw_path.write_bytes(text.encode("utf-8"))
 
     try:
-        data = json.loads(text)
+        data = _fastjson.loads(text)
         if not isinstance(data, list):
             raise ValueError("Top-level JSON is not a list.")
         return data
@@ -91,7 +93,7 @@ def parse_json_safely(text: str, raw_path: Path) -> List[Dict]:
             cleaned = cleaned.strip("`")
             if "\n" in cleaned:
                 cleaned = cleaned.split("\n", 1)[1]
-        data = json.loads(cleaned)
+        data = _fastjson.loads(cleaned)
         if not isinstance(data, list):
             raise ValueError("Top-level JSON is not a list after cleanup.")
         return data
@@ -91,7 +91,11 @@ def main():
         "policy": args.policy,
         "max_attempts": args.max_retries,
         "summary": summary,
-        "results": final.get("results", []),
+        # drop internal helper keys (e.g. "_lc_blob") from the saved cases
+        "results": [
+            {k: v for k, v in c.items() if not k.startswith("_")}
+            for c in final.get("results", [])
+        ],
         "errors": final.get("errors", []),
         "llm_summary": llm_summary,
         "memory_notes": memory_notes,  # 🔹 include in saved report
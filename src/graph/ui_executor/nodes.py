@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import os
+import re
 from pathlib import Path
 import subprocess
+import time
 from typing import Any, Dict, List, Optional, cast
 import xml.etree.ElementTree as ET
 
@@ -12,6 +14,9 @@ import json
 
 from src.memory import memory_store
 
+# LLM triage: attempts before falling back to the rule-based classifier
+LLM_TRIAGE_ATTEMPTS = 3
+
 
 # ---------- Node 1: prepare config ----------
 def prepare_config(state: UIExecState) -> UIExecState:
@@ -29,6 +34,7 @@ def prepare_config(state: UIExecState) -> UIExecState:
     s.setdefault("approved", True)
 
     s.setdefault("results", [])
+    s.setdefault("failures_by_attempt", {})
     s.setdefault("summary", {"total": 0, "passed": 0, "failed": 0, "skipped": 0})
     s.setdefault("errors", [])
 
@@ -110,8 +116,16 @@ def parse_results(state: UIExecState) -> UIExecState:
             message_attr = ""
             details_text = ""
 
-            failure_el = tc.find("failure")
-            skipped_el = tc.find("skipped")
+            # failure/skipped are mutually exclusive: one pass over the children
+            failure_el = skipped_el = None
+            for child in tc:
+                if child.tag == "failure":
+                    failure_el = child
+                    break
+                if child.tag == "skipped":
+                    skipped_el = child
+                    break
+
             if failure_el is not None:
                 status = "failed"
                 # short attribute seen in Playwright JUnit (often file:line title)
@@ -120,7 +134,7 @@ def parse_results(state: UIExecState) -> UIExecState:
                 parts: List[str] = []
                 if failure_el.text:
                     parts.append(str(failure_el.text))
-                for child in list(failure_el):
+                for child in failure_el:
                     if child.text:
                         parts.append(str(child.text))
                     if child.tail:
@@ -145,10 +159,16 @@ def parse_results(state: UIExecState) -> UIExecState:
                 "details": details_text,     # full text (for LLM + classifier)
                 "attempt": int(s.get("attempt", 1) or 1),
                 "project": "UI",
+                "_lc_blob": _lc_blob(name, message_attr, details_text),  # classifier input, lowercased once
             })
 
-        # accumulate results across attempts
+        # accumulate results across attempts, indexing this attempt's failures
         results: List[Dict[str, Any]] = cast(List[Dict[str, Any]], s.setdefault("results", []))
+        by_attempt: Dict[int, List[int]] = cast(Dict[int, List[int]], s.setdefault("failures_by_attempt", {}))
+        base = len(results)
+        attempt_now = int(s.get("attempt", 1) or 1)
+        failed_idx = by_attempt.setdefault(attempt_now, [])
+        failed_idx.extend(base + i for i, c in enumerate(cases) if c["status"] == "failed")
         results.extend(cases)
         s["summary"] = {"total": total, "passed": passed, "failed": failed, "skipped": skipped}
 
@@ -169,8 +189,7 @@ def llm_triage(state: UIExecState) -> UIExecState:
     """
     s = cast(UIExecState, dict(state))
     attempt_now = int(s.get("attempt", 1) or 1)
-    results: List[Dict[str, Any]] = cast(List[Dict[str, Any]], s.get("results", []))
-    failed_now = [c for c in results if c.get("attempt") == attempt_now and c.get("status") == "failed"]
+    failed_now = _failed_cases(s, attempt_now)
 
     # If nothing failed, skip quietly
     if not failed_now:
@@ -228,19 +247,40 @@ def llm_triage(state: UIExecState) -> UIExecState:
                 + json.dumps(payload, ensure_ascii=False)
             )
 
-        # Call your Day-5 LLM client (no temperature kwarg)
-        llm_raw = chat(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_content},
-            ]
-        )
-
-        # Parse strict JSON; fallback to empty on any error
-        try:
-            data = json.loads(llm_raw)
-        except Exception:
-            data = {"summary": "", "labels": []}
+        # Call your Day-5 LLM client in JSON mode (returns parsed JSON); retry with backoff
+        data: Optional[Dict[str, Any]] = None
+        last_err: Optional[Exception] = None
+        for i in range(LLM_TRIAGE_ATTEMPTS):
+            try:
+                llm_out = chat(
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_content},
+                    ],
+                    response_format={"type": "json_object"},
+                )
+                data = json.loads(llm_out) if isinstance(llm_out, str) else llm_out
+                break
+            except Exception as e:
+                last_err = e
+                if i < LLM_TRIAGE_ATTEMPTS - 1:
+                    time.sleep(2 ** i)
+
+        # Final failure → label with the rule-based classifier so retry routing still works
+        if not isinstance(data, dict):
+            errors: List[str] = cast(List[str], s.setdefault("errors", []))
+            errors.append(f"[llm_triage] LLM unavailable, using rule-based labels: {last_err}")
+            data = {
+                "summary": "",
+                "labels": [
+                    {
+                        "name": c.get("name", ""),
+                        "label": "transient" if _is_retry_eligible_ui(c) else "real",
+                        "reason": "rule-based fallback",
+                    }
+                    for c in failed_now
+                ],
+            }
 
         summary_text: str = cast(str, data.get("summary", "") or "")
         labels: List[Dict[str, str]] = cast(List[Dict[str, str]], data.get("labels", []) or [])
@@ -264,15 +304,43 @@ def llm_triage(state: UIExecState) -> UIExecState:
     return s
 
 
+# ---------- Helper: failed cases via the per-attempt index ----------
+def _failed_cases(state: UIExecState, attempt: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Failed cases for one attempt (or all attempts when attempt is None).
+    Uses state['failures_by_attempt'] built by parse_results; falls back to a
+    scan of results when the index is absent (e.g. a hand-built state).
+    """
+    results: List[Dict[str, Any]] = cast(List[Dict[str, Any]], state.get("results", []) or [])
+    by_attempt = state.get("failures_by_attempt")
+    if by_attempt is None:
+        return [
+            c for c in results
+            if c.get("status") == "failed" and (attempt is None or c.get("attempt") == attempt)
+        ]
+    if attempt is None:
+        return [results[i] for a in sorted(by_attempt) for i in by_attempt[a]]
+    return [results[i] for i in by_attempt.get(attempt, [])]
+
+
 # ---------- Helper: simple flaky classifier (rule-based fallback) ----------
+_TRANSIENT_RE = re.compile(r"not visible|timeout|timed out|network|navigation|to be visible")
+
+
+def _lc_blob(name: str, message: str, details: str) -> str:
+    """Lowercased 'name\nmessage\ndetails' — the title is always the first line."""
+    return (name.replace("\n", " ") + "\n" + message + "\n" + details).lower()
+
+
 def _is_retry_eligible_ui(case: Dict[str, Any]) -> bool:
-    title = (case.get("name") or "").lower()
-    msg = (case.get("message") or "").lower()
-    details = (case.get("details") or "").lower()
-    if "@flaky" in title:
+    blob: str = case.get("_lc_blob") or _lc_blob(
+        case.get("name") or "", case.get("message") or "", case.get("details") or ""
+    )
+    title_end = blob.find("\n")
+    # '@flaky' tag is only honoured in the title; transient signals only in message/details
+    if blob.find("@flaky", 0, title_end) != -1:
         return True
-    transient_signals = ("not visible", "timeout", "timed out", "network", "navigation", "to be visible")
-    return any(sig in msg for sig in transient_signals) or any(sig in details for sig in transient_signals)
+    return _TRANSIENT_RE.search(blob, title_end + 1) is not None
 
 
 # ---------- Router: decide after approval (now prefers LLM labels) ----------
@@ -294,8 +362,7 @@ def decide_after_approval(state: UIExecState) -> str:
         return "end"
 
     attempt_now = int(state.get("attempt", 1) or 1)
-    results: List[Dict[str, Any]] = cast(List[Dict[str, Any]], state.get("results", []))
-    failed_cases = [c for c in results if c.get("attempt") == attempt_now and c.get("status") == "failed"]
+    failed_cases = _failed_cases(state, attempt_now)
 
     if state.get("policy") == "always":
         return "retry"
@@ -378,18 +445,17 @@ def persist_to_memory(state: UIExecState) -> UIExecState:
 
     # Check recurrence for each failed test (last 7 days only)
     notes: List[str] = []
-    for case in results:
-        if case.get("status") == "failed":
-            name = case.get("name", "")
-            msg = case.get("message", "")
-            try:
-                count = memory_store.find_recurrences(name, msg, days=7)
-                if count > 1:
-                    notes.append(f"{name}: seen {count} times in last 7 days")
-                else:
-                    notes.append(f"{name}: NEW failure")
-            except Exception as e:
-                notes.append(f"{name}: memory lookup error {e}")
+    for case in _failed_cases(s):
+        name = case.get("name", "")
+        msg = case.get("message", "")
+        try:
+            count = memory_store.find_recurrences(name, msg, days=7)
+            if count > 1:
+                notes.append(f"{name}: seen {count} times in last 7 days")
+            else:
+                notes.append(f"{name}: NEW failure")
+        except Exception as e:
+            notes.append(f"{name}: memory lookup error {e}")
 
     s["memory_notes"] = notes
     return s
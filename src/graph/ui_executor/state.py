@@ -30,6 +30,7 @@ class UIExecState(TypedDict, total=False):
 
     # Parsed results (normalized)
     results: List[Dict[str, Any]]     # Flattened test cases with status, name, duration, etc.
+    failures_by_attempt: Dict[int, List[int]]  # attempt -> indices of failed cases in results
     summary: Dict[str, int]           # {"total": int, "passed": int, "failed": int, "skipped": int}
     errors: List[str]                 # Non-test errors (e.g., file missing, parse failure)
 
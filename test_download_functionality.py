@@ -158,12 +158,18 @@ def test_excel_export():
     ws = wb.active
     ws.title = "Test Cases"
     
+    # Styles are built once and shared by every cell that uses them
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    green_fill = PatternFill(start_color="90EE90", end_color="90EE90", fill_type="solid")
+    yellow_fill = PatternFill(start_color="FFE135", end_color="FFE135", fill_type="solid")
+    
     # Headers
     headers = ['Test ID', 'Title', 'Steps', 'Expected Result', 'Priority', 'Quality Score']
     for col, header in enumerate(headers, 1):
         cell = ws.cell(row=1, column=col, value=header)
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        cell.font = header_font
+        cell.fill = header_fill
     
     # Quality score mapping
     quality_scores = {}
@@ -175,7 +181,7 @@ def test_excel_export():
     # Data rows
     for row, case in enumerate(test_cases, 2):
         steps = case.get("steps", [])
-        steps_text = "\n".join(f"{i+1}. {step}" for i, step in enumerate(steps))
+        steps_text = "\n".join([f"{i}. {step}" for i, step in enumerate(steps, 1)])
         
         test_id = case.get("id", "")
         quality_score = quality_scores.get(test_id, 0)
@@ -191,9 +197,9 @@ def test_excel_export():
         
         # Color code quality scores
         if quality_score >= 8.0:
-            quality_cell.fill = PatternFill(start_color="90EE90", end_color="90EE90", fill_type="solid")
+            quality_cell.fill = green_fill
         elif quality_score >= 6.0:
-            quality_cell.fill = PatternFill(start_color="FFE135", end_color="FFE135", fill_type="solid")
+            quality_cell.fill = yellow_fill
     
     # Save Excel file
     output_dir = Path("outputs/testcase_generated")
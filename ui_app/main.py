@@ -11,28 +11,382 @@ Run: python ui_app/main.py
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-import threading
+import tkinter.font as tkfont
+import asyncio
+from bisect import bisect_right
+import codecs
+import collections
+import io
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import sys
 from pathlib import Path
 import sv_ttk
 import logging
-import csv
+import time
 import json
+import re
 from datetime import datetime
 try:
     import openpyxl
-    from openpyxl.styles import Font, PatternFill, Alignment
-    EXCEL_AVAILABLE = True
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    OPENPYXL_AVAILABLE = True
+    
+    # Shared openpyxl styles for the Excel fallback (style objects are immutable, safe to reuse)
+    _XLSX_HEADER_FONT = Font(bold=True, color="FFFFFF")
+    _XLSX_HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    _XLSX_DETAILS_HEADER_FILL = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
+    _XLSX_HEADER_ALIGN = Alignment(horizontal="center", vertical="center")
+    _XLSX_THIN_BORDER = Border(left=Side(style='thin'), right=Side(style='thin'),
+                               top=Side(style='thin'), bottom=Side(style='thin'))
+    _XLSX_WRAP_TOP = Alignment(wrap_text=True, vertical="top")
+    _XLSX_FILLS = {color: PatternFill(start_color=color, end_color=color, fill_type="solid")
+                   for color in ("90EE90", "FFE135", "FFB6C1", "D3D3D3")}
+    _XLSX_SECTION_FONT = Font(bold=True, size=12)
+    _XLSX_LABEL_FONT = Font(bold=True)
 except ImportError:
-    EXCEL_AVAILABLE = False
+    OPENPYXL_AVAILABLE = False
+try:
+    import xlsxwriter  # faster writer, preferred for Excel export when installed
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+EXCEL_AVAILABLE = OPENPYXL_AVAILABLE or XLSXWRITER_AVAILABLE
+
+# Export header rows: the test cases (CSV and Excel) and the Excel "Quality Details" sheet
+CASE_HEADERS = ('Test ID', 'Title', 'Steps', 'Expected Result', 'Priority', 'Quality Score')
+QUALITY_HEADERS = ('Test ID', 'Clarity', 'Completeness', 'Specificity', 'Testability', 'Coverage', 'Total Score')
+
+# CSV export header, encoded once, and the csv.QUOTE_MINIMAL quoting test
+CSV_HEADER = (",".join(CASE_HEADERS) + "\r\n").encode("utf-8")
+_CSV_NEEDS_QUOTING = re.compile(r'[",\r\n]').search
+# The CSV row buffer is written out whenever it grows past this many bytes
+CSV_FLUSH_BYTES = 1 << 20
 
 # Add the parent directory to sys.path so we can import from src
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.core import chat, pick_requirement, parse_json_safely, to_rows, write_csv, score_test_cases, enhance_requirement
+from src.core import achat, achat_stream, pick_requirement, parse_json_safely, to_rows, write_csv, score_test_cases_parallel, enhance_requirement
+from src.core._fast_xlsx_writer import (
+    FILL_STYLES, STYLE_BOLD, STYLE_DEFAULT, STYLE_DETAILS_HEADER, STYLE_SECTION, STYLE_WRAP, XlsxSheet, write_xlsx_sheets,
+)
 from src.integrations.testrail import map_case_to_testrail_payload, create_case, list_cases, add_result, get_stats
 
 
+# Prompts, loaded once per process rather than per window
+_PROMPTS_DIR = Path(__file__).resolve().parents[1] / "src" / "core" / "prompts"
+_SYSTEM_PROMPT = _PROMPTS_DIR.joinpath("testcase_system.txt").read_text(encoding="utf-8")
+_USER_TEMPLATE = _PROMPTS_DIR.joinpath("testcase_user.txt").read_text(encoding="utf-8")
+
+# Extra system prompt instructions per test type
+_TEST_TYPE_INSTRUCTIONS = {
+    "smoke": """
+Focus on SMOKE TESTS - Critical functionality that must work for basic system operation:
+- Core login/authentication flows
+- Essential business operations
+- Critical user journeys
+- System startup and basic navigation
+- Key integrations that if broken, make system unusable
+Generate 8-12 test cases covering the most critical paths.""",
+
+    "sanity": """
+Focus on SANITY TESTS - Targeted testing after changes or in specific areas:
+- Recently modified functionality
+- Specific feature areas mentioned in requirements
+- Quick verification of key functionality
+- Regression testing for critical areas
+- Narrow but deep testing of mentioned features
+Generate 6-10 focused test cases for the specific areas mentioned.""",
+
+    "unit": """
+Focus on UNIT TESTS - Code-level testing of individual functions/methods:
+- Test each function with valid inputs
+- Test boundary conditions and edge cases
+- Test error handling and exception cases
+- Test different parameter combinations
+- Verify return values and side effects
+- Mock external dependencies if needed
+Generate 10-15 comprehensive unit tests covering all code paths."""
+}
+
+# Complete system prompt per test type, so generation only fills in the requirement
+_SYSTEM_PROMPTS = {
+    test_type: "\n\n".join((_SYSTEM_PROMPT, instructions, f"Test Type: {test_type.upper()} TESTS"))
+    for test_type, instructions in _TEST_TYPE_INSTRUCTIONS.items()
+}
+
+
+# Example requirements offered by the "Load Example" button
+_EXAMPLE_REQUIREMENTS = (
+    """E-Commerce Shopping Cart System:
+
+**Core Functionality:**
+- Users can browse products and add items to cart
+- Cart displays item details, quantities, and total price
+- Users can update quantities or remove items from cart
+- Apply discount codes and promotional offers
+- Calculate shipping costs based on location
+- Support multiple payment methods (credit card, PayPal, digital wallets)
+
+**User Experience Requirements:**
+- Cart contents persist across browser sessions
+- Real-time inventory validation before checkout
+- Clear error messages for invalid operations
+- Mobile-responsive design for all devices
+- Loading indicators for async operations
+
+**Security & Validation:**
+- Validate all user inputs and sanitize data
+- Secure payment processing with encryption
+- Session management and timeout handling
+- Prevent cart manipulation and price tampering
+
+**Performance Requirements:**
+- Cart operations should respond within 2 seconds
+- Support concurrent users without conflicts
+- Graceful handling of network connectivity issues""",
+
+    """User Authentication & Account Management:
+
+**Login System:**
+- Users can log in with email/username and password
+- Support for social media login (Google, Facebook, Apple)
+- Two-factor authentication for enhanced security
+- Remember me functionality with secure tokens
+- Account lockout after multiple failed attempts
+
+**Registration Process:**
+- User registration with email verification
+- Password strength requirements and validation
+- Terms and conditions acceptance
+- Optional profile information collection
+- Welcome email with account setup instructions
+
+**Password Management:**
+- Forgot password functionality with email reset
+- Secure password reset with time-limited tokens
+- Password change with current password verification
+- Password history to prevent reuse of recent passwords
+
+**Account Features:**
+- User profile management and editing
+- Account deactivation and deletion options
+- Login history and security activity logs
+- Privacy settings and notification preferences""",
+
+    """Flight Booking System:
+
+**Search Functionality:**
+- Search flights by origin, destination, and travel dates
+- Support for round-trip, one-way, and multi-city trips
+- Filter results by price, duration, airline, and stops
+- Sort options by price, duration, departure time
+- Flexible date search with calendar view
+
+**Booking Process:**
+- Select flights and view detailed itinerary
+- Passenger information entry with validation
+- Seat selection with interactive seat map
+- Add-on services (baggage, meals, insurance)
+- Payment processing with multiple options
+- Booking confirmation with reference number
+
+**Booking Management:**
+- View booking details and itinerary
+- Modify bookings (date changes, passenger details)
+- Cancel bookings with refund processing
+- Check-in functionality with mobile boarding pass
+- Flight status updates and notifications
+
+**Integration Requirements:**
+- Real-time flight data from airline systems
+- Payment gateway integration for secure transactions
+- Email and SMS notifications for booking updates
+- Integration with loyalty programs and frequent flyer accounts"""
+)
+
+# Test type descriptions shown under the radio buttons
+_DESCRIPTIONS = {
+    "smoke": "Critical functionality tests - Verify core features work",
+    "sanity": "Focused sanity tests - Verify specific functionality after changes", 
+    "unit": "Code-level tests - Verify individual functions/methods work correctly"
+}
+
+# Requirement box placeholder per test type
+_PLACEHOLDERS = {
+    "smoke": """Enter your requirements here...
+
+Example for Smoke Tests:
+User Login System:
+- Users can log in with email and password
+- Dashboard loads after successful login
+- Critical navigation menu is accessible
+- User can log out successfully
+- Basic user profile information displays correctly
+
+Focus on core, critical functionality that must work for the system to be viable.""",
+
+    "sanity": """Enter your requirements here...
+
+Example for Sanity Tests:
+Recent Password Reset Feature Changes:
+- Password reset email is sent successfully
+- Reset link in email works correctly
+- New password meets complexity requirements
+- User can login with new password
+- Old password is no longer valid
+- Password reset link expires after use
+
+Focus on recently changed or specific functionality areas.""",
+
+    "unit": """Enter your code here for unit test generation...
+
+Example Code for Unit Tests:
+```python
+def calculate_discount(price, discount_percent, user_type):
+    \"\"\"Calculate discount amount for a given price.
+    
+    Args:
+        price (float): Original price
+        discount_percent (int): Discount percentage (0-100)
+        user_type (str): Type of user ('regular', 'premium', 'vip')
+    
+    Returns:
+        float: Discounted price
+    \"\"\"
+    if price < 0:
+        raise ValueError("Price cannot be negative")
+    
+    if discount_percent < 0 or discount_percent > 100:
+        raise ValueError("Discount must be between 0 and 100")
+    
+    # Apply additional discount for premium users
+    if user_type == 'premium':
+        discount_percent += 5
+    elif user_type == 'vip':
+        discount_percent += 10
+    
+    # Cap discount at 90%
+    discount_percent = min(discount_percent, 90)
+    
+    discount_amount = price * (discount_percent / 100)
+    return price - discount_amount
+```
+
+Paste your function/class code above for comprehensive unit test generation."""
+}
+
+
+# Results tree column widths as (width, minwidth) in characters of the Consolas 10 tree font
+TREE_COLUMN_CHARS = {
+    'ID': (10, 10),
+    'Title': (28, 21),
+    'Steps': (45, 35),
+    'Expected': (40, 28),
+    'Priority': (13, 11),
+    'Quality': (16, 14),
+}
+
+# Tree cell text limits as (title, steps, expected): [normal, expanded] in the main
+# window (expanded shows more but still limits for readability), and the expanded window
+TREE_TEXT_LIMITS = ((40, 80, 100), (50, 200, 150))
+EXPANDED_WINDOW_TEXT_LIMITS = (60, 300, 200)
+
+# Quality score colours: scores below 6.0 are red, from 6.0 orange, from 8.0 green
+_QUALITY_COLOR_BINS = (6.0, 8.0)
+_QUALITY_COLORS = ("red", "orange", "green")
+# Excel fill colours (RGB hex) on the same bins, and per lower-cased priority
+_EXCEL_SCORE_FILLS = ("FFB6C1", "FFE135", "90EE90")
+_EXCEL_PRIORITY_FILLS = {"high": "FFB6C1", "low": "D3D3D3"}
+
+# Rows inserted per page in the quality report's detailed scores tree
+DETAIL_TREE_PAGE = 200
+# Criterion columns of that tree, formatted in one call per row (split on NUL); missing criteria show 0.0
+_DETAIL_SCORE_TEMPLATE = "{clarity:.1f}\0{completeness:.1f}\0{specificity:.1f}\0{testability:.1f}\0{coverage:.1f}"
+
+# TestRail push: cases per chunk and concurrent requests within a chunk
+TESTRAIL_MAX_BATCH_SIZE = int(os.getenv("TESTRAIL_MAX_BATCH_SIZE") or "500")
+TESTRAIL_PUSH_WORKERS = int(os.getenv("TESTRAIL_PUSH_WORKERS") or "8")
+
+# Excel "Test Cases" sheet column widths (Test ID, Title, Steps, Expected, Priority, Quality), shared by all exporters
+EXCEL_CASE_COLUMN_WIDTHS = (12, 30, 50, 30, 10, 15)
+
+# Excel exports with more cases than this skip the workbook libraries and write the XML directly
+EXCEL_FAST_EXPORT_ROWS = int(os.getenv("EXCEL_FAST_EXPORT_ROWS") or "20000")
+
+# Background jobs (generation, enhancement, exports, TestRail push) share one pool
+UI_BG_WORKERS = int(os.getenv("UI_BG_WORKERS") or "4")
+
+# Close without the "Do you want to quit" prompt (scripted or headless runs)
+NO_CONFIRM_QUIT = os.getenv("TCG_NO_CONFIRM_QUIT", "0").strip().lower() in ("1", "true", "yes")
+
+# Generated cases projected into one list per field (parallel, same order as the cases)
+CaseColumns = collections.namedtuple("CaseColumns", "ids titles steps steps_joined steps_numbered expected priorities")
+
+
+def _steps_to_text(steps):
+    """Steps as numbered lines ("1. ...") for exports and the detail view; non-lists are str()'d."""
+    if isinstance(steps, list):
+        return "\n".join([f"{i}. {step}" for i, step in enumerate(steps, 1)])
+    return str(steps)
+
+
+def _project_cases(cases):
+    """Columns-as-lists view of `cases`, built once per generation and reused by tree and exports.
+    
+    `steps_joined` holds the " | "-joined steps shown in the tree and `steps_numbered` the
+    numbered text used by every export, so neither is rebuilt per refresh or per export.
+    """
+    steps = [c.get("steps", []) for c in cases]
+    return CaseColumns(
+        [c.get("id", "") for c in cases],
+        [c.get("title", "") for c in cases],
+        steps,
+        [" | ".join(s) if isinstance(s, list) else str(s) for s in steps],
+        [_steps_to_text(s) for s in steps],
+        [c.get("expected", "") for c in cases],
+        [c.get("priority", "Medium") for c in cases],
+    )
+
+
+def _truncate(text, limit):
+    """`text` cut to `limit` chars plus an ellipsis; short strings are returned as-is (no copy)."""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+def _quality_fill_color(score):
+    """Excel fill colour for a quality score; None for unscored cases (0 or below)."""
+    return _EXCEL_SCORE_FILLS[bisect_right(_QUALITY_COLOR_BINS, score)] if score > 0 else None
+
+# Quality score cell text, e.g. "8.5/10" (bound method, shared by the row builders)
+_SCORE_FORMAT = "{:.1f}/10".format
+
+# Requirement files are decoded in chunks of this size
+READ_CHUNK_SIZE = 64 * 1024
+
+
+def _read_text_streamed(path, on_progress=None):
+    """Read a UTF-8 text file chunk by chunk, like read_text (universal newlines).
+    
+    `on_progress(bytes_read, total)` is called after every chunk.
+    """
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")(), translate=True)
+    parts = []
+    bytes_read = 0
+    with open(path, "rb") as f:
+        total = os.fstat(f.fileno()).st_size
+        while chunk := f.read(READ_CHUNK_SIZE):
+            parts.append(decoder.decode(chunk))
+            bytes_read += len(chunk)
+            if on_progress is not None:
+                on_progress(bytes_read, total)
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+
 class TestCaseGeneratorApp:
     """Main application window for the TestCase Generator."""
     
@@ -52,9 +406,29 @@ class TestCaseGeneratorApp:
         self.original_requirement_text = ""
         self.enhancement_report = {}
         self.generated_cases = []
+        self._case_columns = _project_cases([])
         self.quality_report = {}
+        self.quality_scores = {}
+        self.quality_details = {}
+        # Quality report dialog texts per kind, as (report they were built from, text)
+        self._report_text_cache = {}
         self.is_processing = False
         self.is_placeholder_text = True
+        self._typing_after_id = None
+        # Set on every req_text modification; the widget text is only re-read when dirty
+        self._req_dirty = True
+        self._req_cache = ""
+        # Last state applied through _set_states, per widget
+        self._widget_states = {}
+        # Expanded view window, built on first open and withdrawn (not destroyed) on close
+        self._expanded_window = None
+        self._expanded_tree = None
+        self._expanded_count_label = None
+        # Quality report window, built on first open and withdrawn on close
+        self._quality_window = None
+        self._quality_window_report = None
+        # Worker threads for the background jobs, started once and reused
+        self._executor = ThreadPoolExecutor(max_workers=UI_BG_WORKERS, thread_name_prefix="ui-bg")
         
         # Setup paths (reuse from existing agent)
         self.ROOT = Path(__file__).resolve().parents[1]
@@ -64,10 +438,10 @@ class TestCaseGeneratorApp:
         self.OUT_CSV = self.OUT_DIR / "test_cases.csv"
         self.LAST_RAW_JSON = self.OUT_DIR / "last_raw.json"
         
-        # Load prompts
-        self.PROMPTS_DIR = self.ROOT / "src" / "core" / "prompts"
-        self.SYSTEM_PROMPT = (self.PROMPTS_DIR / "testcase_system.txt").read_text(encoding="utf-8")
-        self.USER_PROMPT_TEMPLATE = (self.PROMPTS_DIR / "testcase_user.txt").read_text(encoding="utf-8")
+        # Prompts (read once at import)
+        self.PROMPTS_DIR = _PROMPTS_DIR
+        self.SYSTEM_PROMPT = _SYSTEM_PROMPT
+        self.USER_PROMPT_TEMPLATE = _USER_TEMPLATE
         
         # Setup logging
         self.setup_logging()
@@ -98,11 +472,10 @@ class TestCaseGeneratorApp:
         self.scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=self.canvas.yview)
         self.scrollable_frame = ttk.Frame(self.canvas, padding="20")
         
-        # Configure scrolling
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        # Configure scrolling (debounced; bbox only recomputed when the frame's size changed)
+        self._last_bbox_key = None
+        self._bbox_after_id = None
+        self.scrollable_frame.bind("<Configure>", self._schedule_bbox_update)
         
         # Create window in canvas
         self.canvas_window = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
@@ -124,28 +497,46 @@ class TestCaseGeneratorApp:
         self.canvas.grid(row=0, column=0, sticky="nsew")
         self.scrollbar.grid(row=0, column=1, sticky="ns")
     
+    def _schedule_bbox_update(self, event=None):
+        """Coalesce bursts of <Configure> events into one scrollregion update 50 ms later."""
+        if self._bbox_after_id is not None:
+            self.root.after_cancel(self._bbox_after_id)
+        self._bbox_after_id = self.root.after(50, self._update_scrollregion)
+    
+    def _update_scrollregion(self):
+        """Recompute the canvas scrollregion unless the frame's layout is unchanged."""
+        self._bbox_after_id = None
+        frame = self.scrollable_frame
+        key = (frame.winfo_reqwidth(), frame.winfo_reqheight(), len(frame.winfo_children()))
+        if key == self._last_bbox_key:
+            return
+        self._last_bbox_key = key
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    
     def bind_mousewheel(self):
-        """Bind mouse wheel events for scrolling."""
-        def _on_mousewheel(event):
-            self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        def _on_mousewheel_linux(event):
-            if event.num == 4:
-                self.canvas.yview_scroll(-1, "units")
-            elif event.num == 5:
-                self.canvas.yview_scroll(1, "units")
+        """Bind mouse wheel scrolling once for every widget in the main window."""
+        # Platform dispatch resolved once: macOS reports small deltas, Windows multiples of 120
+        self._wheel_delta_sign = -1
+        self._wheel_scale = 1 if sys.platform == "darwin" else 120
         
-        # Bind scrolling to the canvas and the entire application
-        widgets_to_bind = [self.canvas, self.root, self.scrollable_frame]
-        
-        for widget in widgets_to_bind:
-            if sys.platform == "darwin":  # macOS
-                widget.bind("<MouseWheel>", _on_mousewheel)
-            elif sys.platform == "win32":  # Windows  
-                widget.bind("<MouseWheel>", _on_mousewheel)
-            else:  # Linux
-                widget.bind("<Button-4>", _on_mousewheel_linux)
-                widget.bind("<Button-5>", _on_mousewheel_linux)
+        if sys.platform in ("darwin", "win32"):
+            self.root.bind_all("<MouseWheel>", self._global_wheel)
+        else:  # Linux
+            self.root.bind_all("<Button-4>", self._global_wheel_linux)
+            self.root.bind_all("<Button-5>", self._global_wheel_linux)
+    
+    def _in_main_window(self, event):
+        """True for events from the main window (dialogs keep their own scrolling)."""
+        widget = event.widget
+        return isinstance(widget, tk.Misc) and widget.winfo_toplevel() is self.root
+    
+    def _global_wheel(self, event):
+        if self._in_main_window(event):
+            self.canvas.yview_scroll(int(self._wheel_delta_sign * event.delta / self._wheel_scale), "units")
+    
+    def _global_wheel_linux(self, event):
+        if self._in_main_window(event):
+            self.canvas.yview_scroll(-1 if event.num == 4 else 1, "units")
     
     def on_canvas_configure(self, event):
         """Configure canvas scrolling when window is resized."""
@@ -168,25 +559,6 @@ class TestCaseGeneratorApp:
         elif event.keysym == 'End':
             self.canvas.yview_moveto(1)
     
-    def bind_mousewheel_to_widget(self, widget):
-        """Bind mouse wheel scrolling to a specific widget."""
-        def _on_mousewheel(event):
-            self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        def _on_mousewheel_linux(event):
-            if event.num == 4:
-                self.canvas.yview_scroll(-1, "units")
-            elif event.num == 5:
-                self.canvas.yview_scroll(1, "units")
-        
-        if sys.platform == "darwin":  # macOS
-            widget.bind("<MouseWheel>", _on_mousewheel)
-        elif sys.platform == "win32":  # Windows
-            widget.bind("<MouseWheel>", _on_mousewheel)
-        else:  # Linux
-            widget.bind("<Button-4>", _on_mousewheel_linux)
-            widget.bind("<Button-5>", _on_mousewheel_linux)
-    
     def create_widgets(self):
         """Create and layout all UI widgets."""
         # Configure modern styling first
@@ -331,9 +703,6 @@ class TestCaseGeneratorApp:
                                                  insertbackground='black')
         self.req_text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
-        # Bind mouse wheel scrolling to text widget
-        self.bind_mousewheel_to_widget(self.req_text)
-        
         # Add placeholder text
         placeholder_text = """Enter your requirements here...
 
@@ -351,6 +720,7 @@ You can also load requirements from a file and edit them here."""
         self.req_text.config(fg='gray', bg='white')  # Set initial placeholder colors
         self.req_text.bind('<FocusIn>', self.on_text_focus_in)
         self.req_text.bind('<KeyPress>', self.on_text_changed)
+        self.req_text.bind('<<Modified>>', self._on_req_modified)
         
         # Initially hide file controls
         self.file_controls_frame.grid_remove()
@@ -424,13 +794,10 @@ You can also load requirements from a file and edit them here."""
         self.tree.heading('Priority', text='Priority')
         self.tree.heading('Quality', text='Quality Score')
         
-        # Improved column widths for better readability
-        self.tree.column('ID', width=70, minwidth=70)
-        self.tree.column('Title', width=200, minwidth=150)
-        self.tree.column('Steps', width=320, minwidth=250)
-        self.tree.column('Expected', width=280, minwidth=200)
-        self.tree.column('Priority', width=90, minwidth=80)
-        self.tree.column('Quality', width=110, minwidth=100)
+        # Column widths measured once from the tree font (scales with DPI and font size)
+        char_w = tkfont.Font(font=("Consolas", 10)).measure("0")
+        for col, (chars, min_chars) in TREE_COLUMN_CHARS.items():
+            self.tree.column(col, width=char_w * chars, minwidth=char_w * min_chars)
         
         # Scrollbars for treeview
         tree_scroll_y = ttk.Scrollbar(preview_frame, orient=tk.VERTICAL, command=self.tree.yview)
@@ -441,14 +808,31 @@ You can also load requirements from a file and edit them here."""
         tree_scroll_y.grid(row=1, column=1, sticky=(tk.N, tk.S))
         tree_scroll_x.grid(row=2, column=0, sticky=(tk.W, tk.E))
         
-        # Bind mouse wheel scrolling to tree widget
-        self.bind_mousewheel_to_widget(self.tree)
-        
         # Bind double-click event for detailed view
         self.tree.bind('<Double-1>', self.show_test_case_detail)
         
+        # Quality and Actions sections are built on first results (see _ensure_results_widgets)
+        self._results_parent = main_frame
+        self.approve_btn = self.reject_btn = None
+        self.download_csv_btn = self.download_xlsx_btn = None
+        self.quality_btn = self.quality_score_var = self.quality_dist_var = None
+        
+        # Log display
+        log_frame = ttk.LabelFrame(main_frame, text="📊 Activity Log", padding="10")
+        log_frame.grid(row=7, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S))
+        log_frame.columnconfigure(0, weight=1)
+        log_frame.rowconfigure(0, weight=1)
+        
+        self.log_text = scrolledtext.ScrolledText(log_frame, height=8, wrap=tk.WORD)
+        self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+    
+    def _ensure_results_widgets(self):
+        """Build the Quality Assessment and Actions sections the first time results arrive."""
+        if self.approve_btn is not None:
+            return
+        
         # Quality metrics section
-        quality_frame = ttk.LabelFrame(main_frame, text="📊 Quality Assessment", padding="10")
+        quality_frame = ttk.LabelFrame(self._results_parent, text="📊 Quality Assessment", padding="10")
         quality_frame.grid(row=5, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10))
         quality_frame.columnconfigure(1, weight=1)
         
@@ -473,7 +857,7 @@ You can also load requirements from a file and edit them here."""
         self.quality_dist_label.pack(side=tk.LEFT)
         
         # Actions section
-        actions_frame = ttk.LabelFrame(main_frame, text="🔗 Actions", padding="10")
+        actions_frame = ttk.LabelFrame(self._results_parent, text="🔗 Actions", padding="10")
         actions_frame.grid(row=6, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10))
         
         # TestRail actions
@@ -509,23 +893,27 @@ You can also load requirements from a file and edit them here."""
         self.download_xlsx_btn = ttk.Button(download_buttons, text="📊 Download as Excel", 
                                            command=self.download_xlsx, state='disabled')
         self.download_xlsx_btn.pack(side=tk.LEFT)
-        
-        # Log display
-        log_frame = ttk.LabelFrame(main_frame, text="📊 Activity Log", padding="10")
-        log_frame.grid(row=7, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S))
-        log_frame.columnconfigure(0, weight=1)
-        log_frame.rowconfigure(0, weight=1)
-        
-        self.log_text = scrolledtext.ScrolledText(log_frame, height=8, wrap=tk.WORD)
-        self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
     
     def load_default_requirement(self):
-        """Load the first available requirement file."""
+        """Load the first available requirement file (directory scanned off the UI thread)."""
+        self._executor.submit(self._bg_scan_requirements)
+    
+    def _bg_scan_requirements(self):
+        """Find the first requirement file by name; hand it to the UI thread."""
         try:
-            req_files = sorted(self.REQ_DIR.glob("*.txt"))
-            if req_files:
-                self.load_requirement_file(req_files[0])
-                self.logger.info(f"Loaded default requirement: {req_files[0].name}")
+            first = min(self.REQ_DIR.glob("*.txt"), key=lambda p: p.name, default=None)
+            if first is not None:
+                self.root.after(0, self._apply_default_requirement, first)
+        except Exception as e:
+            self.logger.warning(f"Could not load default requirement: {e}")
+    
+    def _apply_default_requirement(self, req_file):
+        """Load the default requirement unless the user already entered or picked one."""
+        if not self.is_placeholder_text or self.requirement_path.get():
+            return
+        try:
+            self.load_requirement_file(req_file)
+            self.logger.info(f"Loaded default requirement: {req_file.name}")
         except Exception as e:
             self.logger.warning(f"Could not load default requirement: {e}")
     
@@ -549,13 +937,7 @@ You can also load requirements from a file and edit them here."""
         test_type = self.test_type.get()
         
         # Update description based on test type
-        descriptions = {
-            "smoke": "Critical functionality tests - Verify core features work",
-            "sanity": "Focused sanity tests - Verify specific functionality after changes", 
-            "unit": "Code-level tests - Verify individual functions/methods work correctly"
-        }
-        
-        self.test_type_desc.config(text=descriptions.get(test_type, ""))
+        self.test_type_desc.config(text=_DESCRIPTIONS.get(test_type, ""))
         
         # Update placeholder text if it's currently showing
         if self.is_placeholder_text:
@@ -565,74 +947,10 @@ You can also load requirements from a file and edit them here."""
     
     def update_placeholder_text(self):
         """Update placeholder text based on selected test type."""
-        test_type = self.test_type.get()
+        text = _PLACEHOLDERS.get(self.test_type.get(), _PLACEHOLDERS["smoke"])
         
-        placeholders = {
-            "smoke": """Enter your requirements here...
-
-Example for Smoke Tests:
-User Login System:
-- Users can log in with email and password
-- Dashboard loads after successful login
-- Critical navigation menu is accessible
-- User can log out successfully
-- Basic user profile information displays correctly
-
-Focus on core, critical functionality that must work for the system to be viable.""",
-
-            "sanity": """Enter your requirements here...
-
-Example for Sanity Tests:
-Recent Password Reset Feature Changes:
-- Password reset email is sent successfully
-- Reset link in email works correctly
-- New password meets complexity requirements
-- User can login with new password
-- Old password is no longer valid
-- Password reset link expires after use
-
-Focus on recently changed or specific functionality areas.""",
-
-            "unit": """Enter your code here for unit test generation...
-
-Example Code for Unit Tests:
-```python
-def calculate_discount(price, discount_percent, user_type):
-    \"\"\"Calculate discount amount for a given price.
-    
-    Args:
-        price (float): Original price
-        discount_percent (int): Discount percentage (0-100)
-        user_type (str): Type of user ('regular', 'premium', 'vip')
-    
-    Returns:
-        float: Discounted price
-    \"\"\"
-    if price < 0:
-        raise ValueError("Price cannot be negative")
-    
-    if discount_percent < 0 or discount_percent > 100:
-        raise ValueError("Discount must be between 0 and 100")
-    
-    # Apply additional discount for premium users
-    if user_type == 'premium':
-        discount_percent += 5
-    elif user_type == 'vip':
-        discount_percent += 10
-    
-    # Cap discount at 90%
-    discount_percent = min(discount_percent, 90)
-    
-    discount_amount = price * (discount_percent / 100)
-    return price - discount_amount
-```
-
-Paste your function/class code above for comprehensive unit test generation."""
-        }
-        
-        # Clear and update placeholder text
-        self.req_text.delete(1.0, tk.END)
-        self.req_text.insert(1.0, placeholders.get(test_type, placeholders["smoke"]))
+        # Swap in the placeholder text (one Tk command)
+        self.req_text.replace(1.0, tk.END, text)
         self.req_text.config(fg='gray', bg='white')
         self.is_placeholder_text = True
     
@@ -644,103 +962,38 @@ Paste your function/class code above for comprehensive unit test generation."""
             self.is_placeholder_text = False
     
     def on_text_changed(self, event):
-        """Handle text changes to track if content is placeholder."""
+        """Handle text changes (debounced: runs once per typing burst)."""
+        if self._typing_after_id is not None:
+            self.root.after_cancel(self._typing_after_id)
+        self._typing_after_id = self.root.after(150, self._apply_text_changes)
+    
+    def _apply_text_changes(self):
+        """Track if content is placeholder (150 ms after the last keypress)."""
+        self._typing_after_id = None
         if self.is_placeholder_text:
             self.is_placeholder_text = False
             self.req_text.config(fg='black', bg='white')
     
+    def _on_req_modified(self, event):
+        """Mark the requirement text dirty and re-arm the widget's modified flag."""
+        if self.req_text.edit_modified():
+            self._req_dirty = True
+            self.req_text.edit_modified(False)
+    
+    def _current_requirement_text(self):
+        """Stripped requirement widget text, fetched from Tk only after a modification."""
+        if self._req_dirty:
+            # Tk counts the characters itself (None when empty), so an empty widget is never copied
+            if self.req_text.count("1.0", "end-1c", "chars"):
+                self._req_cache = self.req_text.get("1.0", "end-1c").strip()
+            else:
+                self._req_cache = ""
+            self._req_dirty = False
+        return self._req_cache
+    
     def load_example_requirement(self):
         """Load an example requirement for demonstration."""
-        example_requirements = [
-            """E-Commerce Shopping Cart System:
-
-**Core Functionality:**
-- Users can browse products and add items to cart
-- Cart displays item details, quantities, and total price
-- Users can update quantities or remove items from cart
-- Apply discount codes and promotional offers
-- Calculate shipping costs based on location
-- Support multiple payment methods (credit card, PayPal, digital wallets)
-
-**User Experience Requirements:**
-- Cart contents persist across browser sessions
-- Real-time inventory validation before checkout
-- Clear error messages for invalid operations
-- Mobile-responsive design for all devices
-- Loading indicators for async operations
-
-**Security & Validation:**
-- Validate all user inputs and sanitize data
-- Secure payment processing with encryption
-- Session management and timeout handling
-- Prevent cart manipulation and price tampering
-
-**Performance Requirements:**
-- Cart operations should respond within 2 seconds
-- Support concurrent users without conflicts
-- Graceful handling of network connectivity issues""",
-
-            """User Authentication & Account Management:
-
-**Login System:**
-- Users can log in with email/username and password
-- Support for social media login (Google, Facebook, Apple)
-- Two-factor authentication for enhanced security
-- Remember me functionality with secure tokens
-- Account lockout after multiple failed attempts
-
-**Registration Process:**
-- User registration with email verification
-- Password strength requirements and validation
-- Terms and conditions acceptance
-- Optional profile information collection
-- Welcome email with account setup instructions
-
-**Password Management:**
-- Forgot password functionality with email reset
-- Secure password reset with time-limited tokens
-- Password change with current password verification
-- Password history to prevent reuse of recent passwords
-
-**Account Features:**
-- User profile management and editing
-- Account deactivation and deletion options
-- Login history and security activity logs
-- Privacy settings and notification preferences""",
-
-            """Flight Booking System:
-
-**Search Functionality:**
-- Search flights by origin, destination, and travel dates
-- Support for round-trip, one-way, and multi-city trips
-- Filter results by price, duration, airline, and stops
-- Sort options by price, duration, departure time
-- Flexible date search with calendar view
-
-**Booking Process:**
-- Select flights and view detailed itinerary
-- Passenger information entry with validation
-- Seat selection with interactive seat map
-- Add-on services (baggage, meals, insurance)
-- Payment processing with multiple options
-- Booking confirmation with reference number
-
-**Booking Management:**
-- View booking details and itinerary
-- Modify bookings (date changes, passenger details)
-- Cancel bookings with refund processing
-- Check-in functionality with mobile boarding pass
-- Flight status updates and notifications
-
-**Integration Requirements:**
-- Real-time flight data from airline systems
-- Payment gateway integration for secure transactions
-- Email and SMS notifications for booking updates
-- Integration with loyalty programs and frequent flyer accounts"""
-        ]
-        
-        import random
-        selected_example = random.choice(example_requirements)
+        selected_example = random.choice(_EXAMPLE_REQUIREMENTS)
         
         self.req_text.delete(1.0, tk.END)
         self.req_text.insert(1.0, selected_example)
@@ -801,6 +1054,18 @@ You can also load requirements from a file and edit them here."""
     
     def open_expanded_view_window(self):
         """Open a new window with expanded test cases view for better usability."""
+        cases_count = len(self.generated_cases)
+        
+        # Reuse the window from an earlier opening: refresh its rows and show it again
+        if self._expanded_window is not None and self._expanded_window.winfo_exists():
+            self._expanded_count_label.config(text=f"Total Test Cases: {cases_count}")
+            self._populate_expanded_tree(self._expanded_tree)
+            self._expanded_window.deiconify()
+            self._expanded_window.lift()
+            self._expanded_window.focus_set()
+            self.logger.info(f"📊 Reopened expanded view window with {cases_count} test cases")
+            return
+        
         # Create expanded view window
         expanded_window = tk.Toplevel(self.root)
         expanded_window.title("📊 Test Cases - Expanded View")
@@ -809,6 +1074,7 @@ You can also load requirements from a file and edit them here."""
         
         # Make it stay on top initially but allow user to manage it
         expanded_window.transient(self.root)
+        expanded_window.protocol("WM_DELETE_WINDOW", expanded_window.withdraw)
         
         # Main frame with padding
         main_frame = ttk.Frame(expanded_window, padding="15")
@@ -834,14 +1100,13 @@ You can also load requirements from a file and edit them here."""
         info_label.grid(row=0, column=1, sticky=tk.E)
         
         # Test cases count
-        cases_count = len(self.generated_cases)
         count_label = ttk.Label(header_frame, text=f"Total Test Cases: {cases_count}", 
                                font=('Arial', 10))
         count_label.grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
         
         # Close button
         close_btn = ttk.Button(header_frame, text="✖️ Close Window", 
-                              command=expanded_window.destroy)
+                              command=expanded_window.withdraw)
         close_btn.grid(row=1, column=1, sticky=tk.E, pady=(5, 0))
         
         # Treeview frame
@@ -882,6 +1147,10 @@ You can also load requirements from a file and edit them here."""
         # Bind double-click for detailed view
         expanded_tree.bind('<Double-1>', lambda event: self.show_test_case_detail_from_tree(event, expanded_tree))
         
+        self._expanded_window = expanded_window
+        self._expanded_tree = expanded_tree
+        self._expanded_count_label = count_label
+        
         # Populate the expanded treeview
         self._populate_expanded_tree(expanded_tree)
         
@@ -911,11 +1180,10 @@ You can also load requirements from a file and edit them here."""
         quality = values[5] if len(values) > 5 else "N/A"
         
         # Find the full test case data for complete details
-        full_case = None
-        for case in self.generated_cases:
-            if case.get("id", "") == test_id:
-                full_case = case
-                break
+        try:
+            full_case = self.generated_cases[self._case_columns.ids.index(test_id)]
+        except ValueError:
+            full_case = None
         
         if full_case:
             # Use full data for the detailed view
@@ -954,10 +1222,8 @@ You can also load requirements from a file and edit them here."""
         
         # Title
         ttk.Label(main_frame, text="Title:", font=('Arial', 10, 'bold')).grid(row=1, column=0, sticky=(tk.W, tk.N), pady=(0, 10))
-        title_text = tk.Text(main_frame, height=2, wrap=tk.WORD, font=('Arial', 10), bg='#f0f0f0', fg='black')
-        title_text.grid(row=1, column=1, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10))
-        title_text.insert(1.0, str(title))
-        title_text.config(state='disabled')
+        ttk.Label(main_frame, text=str(title), font=('Arial', 10), wraplength=600, 
+                  justify='left').grid(row=1, column=1, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10))
         
         # Priority
         ttk.Label(main_frame, text="Priority:", font=('Arial', 10, 'bold')).grid(row=2, column=0, sticky=tk.W, pady=(0, 10))
@@ -979,11 +1245,7 @@ You can also load requirements from a file and edit them here."""
         steps_scroll.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
         # Format steps properly
-        if isinstance(steps, list):
-            formatted_steps = "\n".join([f"{i+1}. {step}" for i, step in enumerate(steps)])
-        else:
-            formatted_steps = str(steps)
-        steps_text.insert(1.0, formatted_steps)
+        steps_text.insert(1.0, _steps_to_text(steps))
         steps_text.config(state='disabled')
         
         # Expected Results
@@ -1020,96 +1282,90 @@ You can also load requirements from a file and edit them here."""
     
     def _populate_expanded_tree(self, tree_widget):
         """Populate the expanded tree with test case data."""
-        # Create quality score mapping for easy lookup
-        quality_scores = {}
-        if self.quality_report and "individual_scores" in self.quality_report:
-            for score_info in self.quality_report["individual_scores"]:
-                test_id = score_info.get("test_id", "")
-                total_score = score_info.get("total_score", 0)
-                quality_scores[test_id] = total_score
-        
         # Populate treeview with more generous text limits for expanded view
-        for case in self.generated_cases:
-            steps = case.get("steps", [])
-            if isinstance(steps, list):
-                steps_text = " | ".join(steps)
-            else:
-                steps_text = str(steps)
-            
-            test_id = case.get("id", "")
-            quality_score = quality_scores.get(test_id, 0)
-            quality_display = f"{quality_score:.1f}/10" if quality_score > 0 else "N/A"
-            
-            # For expanded view, show more text but still reasonable limits
-            title_display = case.get("title", "")[:60] + "..." if len(case.get("title", "")) > 60 else case.get("title", "")
-            steps_display = steps_text[:300] + "..." if len(steps_text) > 300 else steps_text
-            expected_display = case.get("expected", "")[:200] + "..." if len(case.get("expected", "")) > 200 else case.get("expected", "")
-            
-            item = tree_widget.insert('', tk.END, values=(
-                test_id,
-                title_display,
-                steps_display,
-                expected_display,
-                case.get("priority", "Medium"),
-                quality_display
-            ))
-            
-            # Apply color coding to quality column if needed
-            if quality_score > 0:
-                tree_widget.set(item, 'Quality', quality_display)
+        rows = self._tree_rows(EXPANDED_WINDOW_TEXT_LIMITS)
+        items = tree_widget.get_children()
+        if len(items) == len(self.generated_cases):
+            # Reopened window with the same number of cases: rewrite rows in place
+            item = tree_widget.item
+            for iid, values in zip(items, rows):
+                item(iid, values=values)
+            return
+        tree_widget.delete(*items)
+        self._bulk_populate_tree(rows, tree_widget)
     
     def _refresh_tree_display(self):
         """Refresh the tree display with current cases and expanded state."""
         if not self.generated_cases:
             return
+        
+        items = self.tree.get_children()
+        if len(items) == len(self.generated_cases):
+            # Same cases, new text limits: update rows in place (keeps selection and scroll)
+            item = self.tree.item
+            for iid, values in zip(items, self._tree_rows()):
+                item(iid, values=values)
+            return
             
         # Clear and repopulate tree
         self.clear_test_cases()
         
-        # Create quality score mapping for easy lookup
-        quality_scores = {}
-        if self.quality_report and "individual_scores" in self.quality_report:
-            for score_info in self.quality_report["individual_scores"]:
-                test_id = score_info.get("test_id", "")
-                total_score = score_info.get("total_score", 0)
-                quality_scores[test_id] = total_score
-        
         # Populate treeview with appropriate text length
-        for case in self.generated_cases:
-            steps = case.get("steps", [])
-            if isinstance(steps, list):
-                steps_text = " | ".join(steps)
-            else:
-                steps_text = str(steps)
-            
-            test_id = case.get("id", "")
-            quality_score = quality_scores.get(test_id, 0)
-            quality_display = f"{quality_score:.1f}/10" if quality_score > 0 else "N/A"
-            
-            # Handle text display based on expanded state
-            if self.is_expanded:
-                # In expanded view, show more text but still limit for readability
-                steps_display = steps_text[:200] + "..." if len(steps_text) > 200 else steps_text
-                expected_display = case.get("expected", "")[:150] + "..." if len(case.get("expected", "")) > 150 else case.get("expected", "")
-                title_display = case.get("title", "")[:50] + "..." if len(case.get("title", "")) > 50 else case.get("title", "")
-            else:
-                # In normal view, show truncated text
-                steps_display = steps_text[:80] + "..." if len(steps_text) > 80 else steps_text
-                expected_display = case.get("expected", "")[:100] + "..." if len(case.get("expected", "")) > 100 else case.get("expected", "")
-                title_display = case.get("title", "")[:40] + "..." if len(case.get("title", "")) > 40 else case.get("title", "")
-            
-            item = self.tree.insert('', tk.END, values=(
+        self._bulk_populate_tree(self._tree_rows())
+    
+    def _tree_rows(self, limits=None):
+        """Treeview value tuples for all cases, zipped from the column projection.
+        
+        `limits` is (title, steps, expected) max lengths; defaults to the current expanded state.
+        """
+        if limits is None:
+            limits = TREE_TEXT_LIMITS[int(self.is_expanded)]
+        title_max, steps_max, expected_max = limits
+        get_score = self.quality_scores.get
+        fmt_score = _SCORE_FORMAT
+        trunc = _truncate
+        
+        cols = self._case_columns
+        for test_id, title, steps_text, expected, priority in zip(cols.ids, cols.titles, cols.steps_joined, cols.expected, cols.priorities):
+            quality_score = get_score(test_id, 0)
+            yield (
                 test_id,
-                title_display,
-                steps_display,
-                expected_display,
-                case.get("priority", "Medium"),
-                quality_display
-            ))
-            
-            # Apply color coding to quality column
-            if quality_score > 0:
-                self.tree.set(item, 'Quality', quality_display)
+                trunc(title, title_max),
+                trunc(steps_text, steps_max),
+                trunc(expected, expected_max),
+                priority,
+                fmt_score(quality_score) if quality_score > 0 else "N/A"
+            )
+    
+    def _export_rows(self, quality_scores):
+        """(test_id, title, steps_text, expected, priority, quality_score, quality_display) per case for exports."""
+        cols = self._case_columns
+        rows = zip(cols.ids, cols.titles, cols.steps_numbered, cols.expected, cols.priorities)
+        if not quality_scores:
+            # No quality report: every row is unscored, so skip the per-row lookup and formatting
+            for test_id, title, steps_text, expected, priority in rows:
+                yield test_id, title, steps_text, expected, priority, 0, "N/A"
+            return
+        get_score = quality_scores.get
+        fmt_score = _SCORE_FORMAT
+        for test_id, title, steps_text, expected, priority in rows:
+            quality_score = get_score(test_id, 0)
+            quality_display = fmt_score(quality_score) if quality_score > 0 else "N/A"
+            yield test_id, title, steps_text, expected, priority, quality_score, quality_display
+    
+    def _bulk_populate_tree(self, rows, tree=None):
+        """Insert all rows with the tree unmapped and its columns hidden, so Tk lays it out once."""
+        tree = tree or self.tree
+        rows = list(rows)
+        tree.configure(displaycolumns=())
+        tree.grid_remove()
+        try:
+            insert = tree.insert
+            for values in rows:
+                insert('', tk.END, values=values)
+        finally:
+            tree.grid()
+            tree.configure(displaycolumns='#all')
     
     def browse_file(self):
         """Open file dialog to select requirement file."""
@@ -1125,7 +1381,7 @@ You can also load requirements from a file and edit them here."""
         """Load and display requirement file content."""
         try:
             self.requirement_path.set(str(file_path))
-            self.requirement_text = file_path.read_text(encoding="utf-8").strip()
+            self.requirement_text = _read_text_streamed(file_path, self._update_load_progress).strip()
             self.original_requirement_text = self.requirement_text  # Store original
             
             # Switch to file mode
@@ -1150,16 +1406,28 @@ You can also load requirements from a file and edit them here."""
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load requirement file:\n{e}")
     
+    def _update_load_progress(self, bytes_read, total):
+        """Show file loading progress for requirement files larger than one chunk."""
+        if total <= READ_CHUNK_SIZE:
+            return
+        if bytes_read >= total:
+            self.progress.configure(mode='indeterminate', value=0)
+            self.progress_label.config(text="")
+            return
+        self.progress.configure(mode='determinate', maximum=total, value=bytes_read)
+        self.progress_label.config(text=f"Loading file... {bytes_read * 100 // total}%")
+        self.progress.update_idletasks()
+    
     def generate_test_cases(self):
         """Generate test cases using LLM in a separate thread."""
         if self.is_processing:
             return
         
         # Get current requirement text from the text area
-        current_text = self.req_text.get(1.0, tk.END).strip()
+        current_text = self._current_requirement_text()
         
         # Check if we have actual content (not placeholder)
-        if not current_text or self.is_placeholder_text or current_text.startswith("Enter your requirements here"):
+        if not current_text or self.is_placeholder_text:
             messagebox.showwarning("Warning", "Please enter requirements or load from a file first.")
             return
         
@@ -1168,188 +1436,161 @@ You can also load requirements from a file and edit them here."""
         
         # Start generation in background thread
         self.is_processing = True
-        self.generate_btn.config(state='disabled')
+        self._set_states([(self.generate_btn, 'disabled')])
         self.progress.start(10)
         self.progress_label.config(text="Generating test cases...")
         
-        thread = threading.Thread(target=self._generate_test_cases_thread)
-        thread.daemon = True
-        thread.start()
+        self._executor.submit(self._generate_test_cases_thread)
     
     def _generate_test_cases_thread(self):
-        """Background thread for test case generation."""
+        """Background thread for test case generation (hosts the asyncio pipeline)."""
         try:
-            self.logger.info("🤖 Starting test case generation...")
-            
-            # Update progress
-            self.root.after(0, lambda: self.progress_label.config(text="Analyzing requirements..."))
-            
-            # Get test type for customized prompts
-            test_type = self.test_type.get()
-            
-            # Customize system prompt based on test type
-            test_type_instructions = {
-                "smoke": """
-Focus on SMOKE TESTS - Critical functionality that must work for basic system operation:
-- Core login/authentication flows
-- Essential business operations
-- Critical user journeys
-- System startup and basic navigation
-- Key integrations that if broken, make system unusable
-Generate 8-12 test cases covering the most critical paths.""",
-
-                "sanity": """
-Focus on SANITY TESTS - Targeted testing after changes or in specific areas:
-- Recently modified functionality
-- Specific feature areas mentioned in requirements
-- Quick verification of key functionality
-- Regression testing for critical areas
-- Narrow but deep testing of mentioned features
-Generate 6-10 focused test cases for the specific areas mentioned.""",
-
-                "unit": """
-Focus on UNIT TESTS - Code-level testing of individual functions/methods:
-- Test each function with valid inputs
-- Test boundary conditions and edge cases
-- Test error handling and exception cases
-- Test different parameter combinations
-- Verify return values and side effects
-- Mock external dependencies if needed
-Generate 10-15 comprehensive unit tests covering all code paths."""
-            }
-            
-            # Enhanced system prompt with test type context
-            enhanced_system_prompt = f"""{self.SYSTEM_PROMPT}
-
-{test_type_instructions.get(test_type, test_type_instructions['smoke'])}
-
-Test Type: {test_type.upper()} TESTS"""
-            
-            # Prepare messages
-            user_prompt = self.USER_PROMPT_TEMPLATE.format(requirement_text=self.requirement_text)
-            messages = [
-                {"role": "system", "content": enhanced_system_prompt},
-                {"role": "user", "content": user_prompt}
-            ]
-            
-            # Call LLM
-            self.logger.info("📡 Calling LLM API...")
-            self.root.after(0, lambda: self.progress_label.config(text="Generating test cases..."))
-            raw = chat(messages)
-            
-            # Parse response
-            self.logger.info("📝 Parsing LLM response...")
-            self.root.after(0, lambda: self.progress_label.config(text="Processing results..."))
-            cases = parse_json_safely(raw, self.LAST_RAW_JSON)
-            
-            if not cases:
-                self.logger.warning("⚠️ No valid test cases generated, using fallback cases")
-                cases = [
-                    {"id": "TC-001", "title": "Login with valid credentials", 
-                     "steps": ["Enter username", "Enter password", "Click login"], 
-                     "expected": "User is logged in", "priority": "High"},
-                    {"id": "TC-002", "title": "Login with invalid password", 
-                     "steps": ["Enter username", "Enter wrong password", "Click login"], 
-                     "expected": "Error message displayed", "priority": "High"}
-                ]
-            
-            # Save to CSV
-            rows = to_rows(cases)
-            write_csv(rows, self.OUT_CSV)
-            
-            # Perform quality assessment
-            self.logger.info("📊 Assessing test case quality...")
-            try:
-                quality_report = score_test_cases(cases, self.requirement_text, self.OUT_DIR)
-                self.logger.info(f"🔍 Quality Assessment Debug - Report generated: {bool(quality_report)}")
-                if quality_report:
-                    self.logger.info(f"🔍 Quality Assessment Debug - Report keys: {list(quality_report.keys())}")
-            except Exception as e:
-                self.logger.error(f"❌ Quality assessment failed: {e}")
-                # Create a basic quality report as fallback
-                quality_report = self._create_fallback_quality_report(cases)
-            
-            # Update UI in main thread
-            self.root.after(0, self._update_ui_with_cases, cases, quality_report)
-            
+            asyncio.run(self._run_generation())
         except Exception as e:
             self.logger.error(f"❌ Generation failed: {e}")
             self.root.after(0, self._generation_error, str(e))
     
+    async def _run_generation(self):
+        """Generation pipeline: LLM call, then quality scoring while the CSV is saved on an I/O thread."""
+        self.logger.info("🤖 Starting test case generation...")
+        
+        # Update progress
+        self.root.after(0, lambda: self.progress_label.config(text="Analyzing requirements..."))
+        
+        # Get test type for customized prompts
+        test_type = self.test_type.get()
+        
+        # System prompt for the test type (built once at import)
+        enhanced_system_prompt = _SYSTEM_PROMPTS.get(test_type, _SYSTEM_PROMPTS["smoke"])
+        
+        # Prepare messages
+        user_prompt = self.USER_PROMPT_TEMPLATE.format(requirement_text=self.requirement_text)
+        messages = [
+            {"role": "system", "content": enhanced_system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+        
+        # Call LLM
+        self.logger.info("📡 Calling LLM API...")
+        self.root.after(0, lambda: self.progress_label.config(text="Generating test cases..."))
+        raw = await self._stream_llm(messages)
+        
+        # Parse response (the full text is authoritative; streamed rows were a preview)
+        self.logger.info("📝 Parsing LLM response...")
+        self.root.after(0, lambda: self.progress_label.config(text="Processing results..."))
+        cases = parse_json_safely(raw, self.LAST_RAW_JSON)
+        
+        if not cases:
+            self.logger.warning("⚠️ No valid test cases generated, using fallback cases")
+            cases = [
+                {"id": "TC-001", "title": "Login with valid credentials", 
+                 "steps": ["Enter username", "Enter password", "Click login"], 
+                 "expected": "User is logged in", "priority": "High"},
+                {"id": "TC-002", "title": "Login with invalid password", 
+                 "steps": ["Enter username", "Enter wrong password", "Click login"], 
+                 "expected": "Error message displayed", "priority": "High"}
+            ]
+        
+        # Save to CSV on its own I/O thread while quality is assessed (both only need the cases)
+        self._executor.submit(self._write_output_csv, to_rows(cases))
+        quality_report = await self._assess_quality(cases)
+        
+        # Update UI in main thread
+        self.root.after(0, self._update_ui_with_cases, cases, quality_report)
+    
+    def _write_output_csv(self, rows):
+        """Save generated rows to OUT_CSV (I/O thread)."""
+        try:
+            write_csv(rows, self.OUT_CSV)
+        except Exception as e:
+            self.logger.error(f"❌ Failed to save {self.OUT_CSV.name}: {e}")
+    
+    async def _stream_llm(self, messages):
+        """Stream the LLM reply, previewing each case in the tree as soon as its object closes.
+        
+        Returns the full raw text; falls back to a single `achat` call if streaming fails.
+        """
+        parser = _CaseStreamParser()
+        self.root.after(0, lambda: self.tree.delete(*self.tree.get_children()))
+        try:
+            async for chunk in achat_stream(messages):
+                for case in parser.feed(chunk):
+                    self.root.after(0, self._append_case, case)
+            return parser.raw.getvalue()
+        except Exception as e:
+            self.logger.warning(f"⚠️ Streaming failed ({e}), waiting for the full response")
+            return await achat(messages)
+    
+    def _append_case(self, case):
+        """Insert one streamed case as a preview row (called from main thread)."""
+        title_max, steps_max, expected_max = TREE_TEXT_LIMITS[int(self.is_expanded)]
+        steps = case.get("steps", [])
+        steps_text = " | ".join(steps) if isinstance(steps, list) else str(steps)
+        self.tree.insert('', tk.END, values=(
+            case.get("id", ""),
+            _truncate(case.get("title", ""), title_max),
+            _truncate(steps_text, steps_max),
+            _truncate(case.get("expected", ""), expected_max),
+            case.get("priority", "Medium"),
+            "Scoring..."
+        ))
+        self.progress_label.config(text=f"Generating test cases... ({len(self.tree.get_children())} received)")
+    
+    async def _assess_quality(self, cases):
+        """Score the cases off the event loop; fall back to the heuristic report on failure."""
+        self.logger.info("📊 Assessing test case quality...")
+        try:
+            quality_report = await asyncio.to_thread(score_test_cases_parallel, cases, self.requirement_text, self.OUT_DIR)
+            self.logger.debug("🔍 Quality Assessment Debug - Report generated: %s", bool(quality_report))
+            if quality_report:
+                self.logger.debug("🔍 Quality Assessment Debug - Report keys: %s", quality_report.keys())
+        except Exception as e:
+            self.logger.error(f"❌ Quality assessment failed: {e}")
+            # Create a basic quality report as fallback
+            quality_report = self._create_fallback_quality_report(cases)
+        return quality_report
+    
     def _update_ui_with_cases(self, cases, quality_report=None):
         """Update UI with generated test cases and quality assessment (called from main thread)."""
         self.generated_cases = cases
+        self._case_columns = _project_cases(cases)
         self.quality_report = quality_report or {}
+        # Score lookups built once per report, reused by every tree repopulation and export
+        self.quality_scores = {}
+        self.quality_details = {}  # test_id -> (criterion scores, total score)
+        for score_info in self.quality_report.get("individual_scores", ()):
+            test_id = score_info.get("test_id", "")
+            total_score = score_info.get("total_score", 0)
+            self.quality_scores[test_id] = total_score
+            self.quality_details[test_id] = (score_info.get("scores", {}), total_score)
         
         # Debug logging
-        self.logger.info(f"🔍 Update UI Debug - Quality report received: {bool(quality_report)}")
-        self.logger.info(f"🔍 Update UI Debug - Quality report set: {bool(self.quality_report)}")
+        self.logger.debug("🔍 Update UI Debug - Quality report received: %s", bool(quality_report))
+        self.logger.debug("🔍 Update UI Debug - Quality report set: %s", bool(self.quality_report))
         
-        # Clear previous results (just the tree, not quality report)
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._ensure_results_widgets()
         
-        # Create quality score mapping for easy lookup
-        quality_scores = {}
-        if quality_report and "individual_scores" in quality_report:
-            for score_info in quality_report["individual_scores"]:
-                test_id = score_info.get("test_id", "")
-                total_score = score_info.get("total_score", 0)
-                quality_scores[test_id] = total_score
+        # Clear previous results (just the tree, not quality report)
+        self.tree.delete(*self.tree.get_children())
         
         # Populate treeview with quality scores
-        for case in cases:
-            steps = case.get("steps", [])
-            if isinstance(steps, list):
-                steps_text = " | ".join(steps)
-            else:
-                steps_text = str(steps)
-            
-            test_id = case.get("id", "")
-            quality_score = quality_scores.get(test_id, 0)
-            quality_display = f"{quality_score:.1f}/10" if quality_score > 0 else "N/A"
-            
-            # Color code quality score
-            quality_color = self._get_quality_color(quality_score)
-            
-            # Handle text display based on expanded state
-            if self.is_expanded:
-                # In expanded view, show more text but still limit for readability
-                steps_display = steps_text[:200] + "..." if len(steps_text) > 200 else steps_text
-                expected_display = case.get("expected", "")[:150] + "..." if len(case.get("expected", "")) > 150 else case.get("expected", "")
-                title_display = case.get("title", "")[:50] + "..." if len(case.get("title", "")) > 50 else case.get("title", "")
-            else:
-                # In normal view, show truncated text
-                steps_display = steps_text[:80] + "..." if len(steps_text) > 80 else steps_text
-                expected_display = case.get("expected", "")[:100] + "..." if len(case.get("expected", "")) > 100 else case.get("expected", "")
-                title_display = case.get("title", "")[:40] + "..." if len(case.get("title", "")) > 40 else case.get("title", "")
-            
-            item = self.tree.insert('', tk.END, values=(
-                test_id,
-                title_display,
-                steps_display,
-                expected_display,
-                case.get("priority", "Medium"),
-                quality_display
-            ))
-            
-            # Apply color coding to quality column
-            if quality_score > 0:
-                self.tree.set(item, 'Quality', quality_display)
+        self._bulk_populate_tree(self._tree_rows())
         
         # Update quality metrics display
         self._update_quality_display()
         
         # Enable approval and download buttons
-        self.approve_btn.config(state='normal')
-        self.reject_btn.config(state='normal')
-        self.download_csv_btn.config(state='normal')
-        self.download_xlsx_btn.config(state='normal' if EXCEL_AVAILABLE else 'disabled')
+        self._set_states([
+            (self.approve_btn, 'normal'),
+            (self.reject_btn, 'normal'),
+            (self.download_csv_btn, 'normal'),
+            (self.download_xlsx_btn, 'normal' if EXCEL_AVAILABLE else 'disabled'),
+        ])
         
         # Ensure quality button is enabled if we have any quality report
         if self.quality_report:
-            self.quality_btn.config(state='normal')
-            self.logger.info("🔍 Quality button explicitly enabled")
+            self._set_states([(self.quality_btn, 'normal')])
+            self.logger.debug("🔍 Quality button explicitly enabled")
         
         # Log quality summary if available
         if quality_report:
@@ -1366,7 +1607,7 @@ Test Type: {test_type.upper()} TESTS"""
             return
         
         # Get current text from the text widget (in case user edited it)
-        current_text = self.req_text.get(1.0, tk.END).strip()
+        current_text = self._current_requirement_text()
         
         if not current_text:
             messagebox.showwarning("Warning", "Please load a requirement file first.")
@@ -1374,13 +1615,10 @@ Test Type: {test_type.upper()} TESTS"""
         
         # Start enhancement in background thread
         self.is_processing = True
-        self.enhance_btn.config(state='disabled')
-        self.generate_btn.config(state='disabled')
+        self._set_states([(self.enhance_btn, 'disabled'), (self.generate_btn, 'disabled')])
         self.progress.start(10)
         
-        thread = threading.Thread(target=self._enhance_requirement_thread, args=(current_text,))
-        thread.daemon = True
-        thread.start()
+        self._executor.submit(self._enhance_requirement_thread, current_text)
     
     def _enhance_requirement_thread(self, requirement_text):
         """Background thread for requirement enhancement."""
@@ -1427,8 +1665,7 @@ Test Type: {test_type.upper()} TESTS"""
     def _stop_enhancement_processing(self):
         """Stop enhancement processing indicators."""
         self.is_processing = False
-        self.enhance_btn.config(state='normal')
-        self.generate_btn.config(state='normal')
+        self._set_states([(self.enhance_btn, 'normal'), (self.generate_btn, 'normal')])
         self.progress.stop()
     
     def _show_enhancement_summary(self, report):
@@ -1478,8 +1715,7 @@ Clarity: {clarity_score:.1f}/10  |  Completeness: {completeness_score:.1f}/10  |
             imp_text = scrolledtext.ScrolledText(imp_frame, height=6, wrap=tk.WORD)
             imp_text.pack(fill=tk.BOTH, expand=True)
             
-            for i, improvement in enumerate(improvements, 1):
-                imp_text.insert(tk.END, f"{i}. {improvement}\n")
+            imp_text.insert(tk.END, "".join(f"{i}. {improvement}\n" for i, improvement in enumerate(improvements, 1)))
             imp_text.config(state='disabled')
         
         # Recommendations section
@@ -1491,8 +1727,7 @@ Clarity: {clarity_score:.1f}/10  |  Completeness: {completeness_score:.1f}/10  |
             rec_text = scrolledtext.ScrolledText(rec_frame, height=6, wrap=tk.WORD)
             rec_text.pack(fill=tk.BOTH, expand=True)
             
-            for i, rec in enumerate(recommendations, 1):
-                rec_text.insert(tk.END, f"{i}. {rec}\n")
+            rec_text.insert(tk.END, "".join(f"{i}. {rec}\n" for i, rec in enumerate(recommendations, 1)))
             rec_text.config(state='disabled')
         
         # Buttons
@@ -1534,10 +1769,12 @@ Clarity: {clarity_score:.1f}/10  |  Completeness: {completeness_score:.1f}/10  |
         enhanced_frame = ttk.Frame(notebook)
         notebook.add(enhanced_frame, text="🟢 Enhanced")
         
-        enhanced_text = scrolledtext.ScrolledText(enhanced_frame, wrap=tk.WORD)
+        # Read-only peer of the requirement box: shares its text buffer, nothing is copied
+        enhanced_text = _TextPeer(enhanced_frame, self.req_text, wrap=tk.WORD, state='disabled')
+        enhanced_scroll = ttk.Scrollbar(enhanced_frame, orient=tk.VERTICAL, command=enhanced_text.yview)
+        enhanced_text.configure(yscrollcommand=enhanced_scroll.set)
+        enhanced_scroll.pack(side=tk.RIGHT, fill=tk.Y, pady=5)
         enhanced_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        enhanced_text.insert(1.0, self.requirement_text)
-        enhanced_text.config(state='disabled')
         
         # Close button
         ttk.Button(comparison_window, text="Close", 
@@ -1545,27 +1782,20 @@ Clarity: {clarity_score:.1f}/10  |  Completeness: {completeness_score:.1f}/10  |
     
     def _get_quality_color(self, score):
         """Get color coding for quality score."""
-        if score >= 8.0:
-            return "green"
-        elif score >= 6.0:
-            return "orange" 
-        elif score > 0:
-            return "red"
-        else:
-            return "gray"
+        return _QUALITY_COLORS[bisect_right(_QUALITY_COLOR_BINS, score)] if score > 0 else "gray"
     
     def _update_quality_display(self):
         """Update the quality metrics display - only enable button after generation."""
         # Debug logging
-        self.logger.info(f"🔍 Quality Display Debug - Quality report exists: {bool(self.quality_report)}")
+        self.logger.debug("🔍 Quality Display Debug - Quality report exists: %s", bool(self.quality_report))
         if self.quality_report:
-            self.logger.info(f"🔍 Quality Display Debug - Report keys: {list(self.quality_report.keys())}")
-            self.logger.info(f"🔍 Quality Display Debug - Overall score: {self.quality_report.get('overall_score', 'Not found')}")
+            self.logger.debug("🔍 Quality Display Debug - Report keys: %s", self.quality_report.keys())
+            self.logger.debug("🔍 Quality Display Debug - Overall score: %s", self.quality_report.get('overall_score', 'Not found'))
         
         if not self.quality_report:
             self.quality_score_var.set("Click 'View Quality Report' after generating test cases")
             self.quality_dist_var.set("")
-            self.quality_btn.config(state='disabled')
+            self._set_states([(self.quality_btn, 'disabled')])
             return
         
         # Show brief indication that quality assessment is ready
@@ -1573,7 +1803,7 @@ Clarity: {clarity_score:.1f}/10  |  Completeness: {completeness_score:.1f}/10  |
         self.quality_dist_var.set("Click 'View Quality Report' button to see detailed metrics")
         
         # Enable quality report button - this is the key change
-        self.quality_btn.config(state='normal')
+        self._set_states([(self.quality_btn, 'normal')])
     
     def show_quality_report(self):
         """Show detailed quality report in a popup window."""
@@ -1584,22 +1814,31 @@ Clarity: {clarity_score:.1f}/10  |  Completeness: {completeness_score:.1f}/10  |
                                "Please check the application logs for more details.")
             return
         
-        # Create quality report window
+        # Build the window on first use; later openings reuse it and only refill for a new report
+        if self._quality_window is None or not self._quality_window.winfo_exists():
+            self._build_quality_window()
+        else:
+            self._quality_window.deiconify()
+            self._quality_window.lift()
+        self._quality_window.grab_set()
+        
+        if self._quality_window_report is not self.quality_report:
+            self._refresh_quality_window()
+    
+    def _build_quality_window(self):
+        """Create the quality report window and its tabs (filled by _refresh_quality_window)."""
         quality_window = tk.Toplevel(self.root)
         quality_window.title("📊 Test Case Quality Report")
         quality_window.geometry("900x700")
         quality_window.transient(self.root)
-        quality_window.grab_set()
+        quality_window.protocol("WM_DELETE_WINDOW", self._close_quality_window)
         
         # Add overall score header
         header_frame = ttk.Frame(quality_window)
         header_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        overall_score = self.quality_report.get("overall_score", 0)
-        score_color = "green" if overall_score >= 8.0 else "orange" if overall_score >= 6.0 else "red"
-        
-        ttk.Label(header_frame, text=f"Overall Quality Score: {overall_score:.1f}/10", 
-                 font=('Arial', 14, 'bold'), foreground=score_color).pack()
+        self._quality_score_label = ttk.Label(header_frame, font=('Arial', 14, 'bold'))
+        self._quality_score_label.pack()
         
         # Create notebook for different tabs
         notebook = ttk.Notebook(quality_window)
@@ -1609,13 +1848,8 @@ Clarity: {clarity_score:.1f}/10  |  Completeness: {completeness_score:.1f}/10  |
         summary_frame = ttk.Frame(notebook)
         notebook.add(summary_frame, text="📊 Summary")
         
-        summary_text = scrolledtext.ScrolledText(summary_frame, wrap=tk.WORD, height=20)
-        summary_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Generate summary content
-        summary_content = self._generate_quality_summary()
-        summary_text.insert(1.0, summary_content)
-        summary_text.config(state='disabled')
+        self._quality_summary_text = scrolledtext.ScrolledText(summary_frame, wrap=tk.WORD, height=20)
+        self._quality_summary_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Individual scores tab
         details_frame = ttk.Frame(notebook)
@@ -1629,109 +1863,162 @@ Clarity: {clarity_score:.1f}/10  |  Completeness: {completeness_score:.1f}/10  |
             detail_tree.heading(col, text=col)
             detail_tree.column(col, width=100, minwidth=80)
         
-        # Populate individual scores
-        individual_scores = self.quality_report.get("individual_scores", [])
-        for score_info in individual_scores:
-            test_id = score_info.get("test_id", "")
-            scores = score_info.get("scores", {})
-            total_score = score_info.get("total_score", 0)
-            
-            detail_tree.insert('', tk.END, values=(
-                test_id,
-                f"{scores.get('clarity', 0):.1f}",
-                f"{scores.get('completeness', 0):.1f}",
-                f"{scores.get('specificity', 0):.1f}",
-                f"{scores.get('testability', 0):.1f}",
-                f"{scores.get('coverage', 0):.1f}",
-                f"{total_score:.1f}"
-            ))
-        
-        # Add scrollbar to detail tree
-        detail_scroll = ttk.Scrollbar(details_frame, orient=tk.VERTICAL, command=detail_tree.yview)
-        detail_tree.configure(yscrollcommand=detail_scroll.set)
+        # One tag per score colour; rows reference them by name instead of being styled one by one
+        for color in _QUALITY_COLORS + ("gray",):
+            detail_tree.tag_configure(color, foreground=color)
+        
+        # Add scrollbar to detail tree (the next page of rows is added whenever the view reaches the end)
+        self._detail_scroll = ttk.Scrollbar(details_frame, orient=tk.VERTICAL, command=detail_tree.yview)
+        detail_tree.configure(yscrollcommand=self._on_detail_yscroll)
         
         detail_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0), pady=5)
-        detail_scroll.pack(side=tk.RIGHT, fill=tk.Y, pady=5)
+        self._detail_scroll.pack(side=tk.RIGHT, fill=tk.Y, pady=5)
+        self._detail_tree = detail_tree
         
         # Recommendations tab
         recommendations_frame = ttk.Frame(notebook)
         notebook.add(recommendations_frame, text="💡 Recommendations")
         
-        rec_text = scrolledtext.ScrolledText(recommendations_frame, wrap=tk.WORD, height=20)
-        rec_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Generate recommendations content
-        rec_content = self._generate_recommendations_content()
-        rec_text.insert(1.0, rec_content)
-        rec_text.config(state='disabled')
+        self._quality_rec_text = scrolledtext.ScrolledText(recommendations_frame, wrap=tk.WORD, height=20)
+        self._quality_rec_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Close button
-        close_btn = ttk.Button(quality_window, text="Close", command=quality_window.destroy)
+        close_btn = ttk.Button(quality_window, text="Close", command=self._close_quality_window)
         close_btn.pack(pady=5)
+        
+        self._quality_window = quality_window
+        self._quality_window_report = None
+    
+    def _refresh_quality_window(self):
+        """Fill the quality report window from the current quality report."""
+        overall_score = self.quality_report.get("overall_score", 0)
+        score_color = _QUALITY_COLORS[bisect_right(_QUALITY_COLOR_BINS, overall_score)]
+        self._quality_score_label.config(text=f"Overall Quality Score: {overall_score:.1f}/10", foreground=score_color)
+        
+        # Summary and recommendations texts
+        for text_widget, content in (
+            (self._quality_summary_text, self._cached_report_text("summary", self._generate_quality_summary)),
+            (self._quality_rec_text, self._cached_report_text("recommendations", self._generate_recommendations_content)),
+        ):
+            text_widget.config(state='normal')
+            text_widget.delete(1.0, tk.END)
+            text_widget.insert(1.0, content)
+            text_widget.config(state='disabled')
+        
+        # Individual scores: rows formatted up front, inserted a page at a time
+        rows = []
+        format_scores = _DETAIL_SCORE_TEMPLATE.format_map
+        for score_info in self.quality_report.get("individual_scores", []):
+            total_score = score_info.get("total_score", 0)
+            tag = _QUALITY_COLORS[bisect_right(_QUALITY_COLOR_BINS, total_score)] if total_score > 0 else "gray"
+            criteria = format_scores(collections.defaultdict(float, score_info.get("scores", {}))).split("\0")
+            rows.append(((score_info.get("test_id", ""), *criteria, f"{total_score:.1f}"), (tag,)))
+        children = self._detail_tree.get_children()
+        if children:
+            self._detail_tree.delete(*children)
+        self._detail_rows = rows
+        self._detail_loaded = 0
+        self._load_more_detail_rows()
+        
+        self._quality_window_report = self.quality_report
+    
+    def _load_more_detail_rows(self):
+        """Insert the next DETAIL_TREE_PAGE rows into the detailed scores tree."""
+        start = self._detail_loaded
+        insert = self._detail_tree.insert
+        for values, tags in self._detail_rows[start:start + DETAIL_TREE_PAGE]:
+            insert('', tk.END, values=values, tags=tags)
+        self._detail_loaded = min(len(self._detail_rows), start + DETAIL_TREE_PAGE)
+    
+    def _on_detail_yscroll(self, first, last):
+        """Scrollbar update for the detailed scores tree; loads another page at the end."""
+        self._detail_scroll.set(first, last)
+        if float(last) >= 1.0 and self._detail_loaded < len(self._detail_rows):
+            self._load_more_detail_rows()
+    
+    def _close_quality_window(self):
+        """Hide the quality report window (kept for the next opening)."""
+        self._quality_window.grab_release()
+        self._quality_window.withdraw()
+    
+    def _cached_report_text(self, kind, build):
+        """`build()` for the current quality report, rebuilt only when the report object changes."""
+        cached = self._report_text_cache.get(kind)
+        if cached is not None and cached[0] is self.quality_report:
+            return cached[1]
+        text = build()
+        self._report_text_cache[kind] = (self.quality_report, text)
+        return text
     
     def _generate_quality_summary(self):
         """Generate quality summary text."""
         if not self.quality_report:
             return "No quality assessment available."
         
-        lines = []
+        buf = io.StringIO()
+        w = buf.write
         overall_score = self.quality_report.get("overall_score", 0)
         individual_scores = self.quality_report.get("individual_scores", [])
         insights = self.quality_report.get("quality_insights", {})
         
-        lines.append("🎯 TEST CASE QUALITY ASSESSMENT REPORT")
-        lines.append("=" * 50)
-        lines.append("")
+        w("🎯 TEST CASE QUALITY ASSESSMENT REPORT\n")
+        w("=" * 50 + "\n")
+        w("\n")
         
-        lines.append(f"📊 Overall Quality Score: {overall_score:.1f}/10")
-        lines.append(f"📝 Total Test Cases Evaluated: {len(individual_scores)}")
-        lines.append("")
+        w(f"📊 Overall Quality Score: {overall_score:.1f}/10\n")
+        w(f"📝 Total Test Cases Evaluated: {len(individual_scores)}\n")
+        w("\n")
         
         # Quality distribution
         if individual_scores:
-            high_quality = sum(1 for s in individual_scores if s.get("total_score", 0) >= 8.0)
-            medium_quality = sum(1 for s in individual_scores if 6.0 <= s.get("total_score", 0) < 8.0)
-            low_quality = sum(1 for s in individual_scores if s.get("total_score", 0) < 6.0)
-            
-            lines.append("🎯 Quality Distribution:")
-            lines.append(f"  🟢 High Quality (8.0+): {high_quality} tests")
-            lines.append(f"  🟡 Medium Quality (6.0-7.9): {medium_quality} tests")
-            lines.append(f"  🔴 Low Quality (<6.0): {low_quality} tests")
-            lines.append("")
+            # One pass: counts indexed like _QUALITY_COLORS (low, medium, high)
+            counts = [0, 0, 0]
+            for s in individual_scores:
+                counts[bisect_right(_QUALITY_COLOR_BINS, s.get("total_score", 0))] += 1
+            low_quality, medium_quality, high_quality = counts
+            
+            w("🎯 Quality Distribution:\n")
+            w(f"  🟢 High Quality (8.0+): {high_quality} tests\n")
+            w(f"  🟡 Medium Quality (6.0-7.9): {medium_quality} tests\n")
+            w(f"  🔴 Low Quality (<6.0): {low_quality} tests\n")
+            w("\n")
         
         # Overall feedback
         overall_feedback = insights.get("overall_feedback", "")
         if overall_feedback:
-            lines.append("📝 Overall Assessment:")
-            lines.append(overall_feedback)
-            lines.append("")
+            w("📝 Overall Assessment:\n")
+            w(f"{overall_feedback}\n")
+            w("\n")
         
         # Strengths
         strengths = insights.get("strengths", [])
         if strengths:
-            lines.append("✅ Key Strengths:")
+            w("✅ Key Strengths:\n")
             for strength in strengths:
-                lines.append(f"  • {strength}")
-            lines.append("")
+                w(f"  • {strength}\n")
+            w("\n")
         
         # Coverage gaps
         coverage_gaps = insights.get("coverage_gaps", [])
         if coverage_gaps:
-            lines.append("⚠️ Coverage Gaps:")
+            w("⚠️ Coverage Gaps:\n")
             for gap in coverage_gaps:
-                lines.append(f"  • {gap}")
-            lines.append("")
+                w(f"  • {gap}\n")
+            w("\n")
         
-        return "\n".join(lines)
+        return buf.getvalue()[:-1]  # no trailing newline, as with "\n".join
     
     def _create_fallback_quality_report(self, cases):
         """Create a basic quality report when AI assessment fails."""
-        individual_scores = []
-        total_score = 0
+        # Fixed for every case: testability is a default assumption, coverage a conservative estimate
+        testability_score = 7.0
+        coverage_score = 6.5
+        fixed_total = testability_score + coverage_score
         
+        individual_scores = []
+        append = individual_scores.append
         for case in cases:
             # Basic scoring based on case completeness
-            case_id = case.get('id', 'TC-000')
             title = case.get('title', '')
             steps = case.get('steps', [])
             expected = case.get('expected', '')
@@ -1740,16 +2027,10 @@ Clarity: {clarity_score:.1f}/10  |  Completeness: {completeness_score:.1f}/10  |
             clarity_score = 7.0 if title and len(title) > 10 else 5.0
             completeness_score = 8.0 if steps and len(steps) >= 2 else 6.0
             specificity_score = 7.5 if expected and len(expected) > 20 else 5.5
-            testability_score = 7.0  # Default assumption
-            coverage_score = 6.5  # Conservative estimate
             
-            case_total = (clarity_score + completeness_score + specificity_score + 
-                         testability_score + coverage_score) / 5
-            total_score += case_total
-            
-            individual_scores.append({
-                "test_id": case_id,
-                "total_score": case_total,
+            append({
+                "test_id": case.get('id', 'TC-000'),
+                "total_score": (clarity_score + completeness_score + specificity_score + fixed_total) / 5,
                 "scores": {
                     "clarity": clarity_score,
                     "completeness": completeness_score,
@@ -1760,7 +2041,7 @@ Clarity: {clarity_score:.1f}/10  |  Completeness: {completeness_score:.1f}/10  |
                 "feedback": "Basic assessment (AI scoring unavailable)"
             })
         
-        overall_score = total_score / len(cases) if cases else 0
+        overall_score = sum(s["total_score"] for s in individual_scores) / len(cases) if cases else 0
         
         return {
             "overall_score": overall_score,
@@ -1778,33 +2059,34 @@ Clarity: {clarity_score:.1f}/10  |  Completeness: {completeness_score:.1f}/10  |
         if not self.quality_report:
             return "No recommendations available."
         
-        lines = []
+        buf = io.StringIO()
+        w = buf.write
         insights = self.quality_report.get("quality_insights", {})
         individual_scores = self.quality_report.get("individual_scores", [])
         
-        lines.append("💡 IMPROVEMENT RECOMMENDATIONS")
-        lines.append("=" * 40)
-        lines.append("")
+        w("💡 IMPROVEMENT RECOMMENDATIONS\n")
+        w("=" * 40 + "\n")
+        w("\n")
         
         # General recommendations
         recommendations = insights.get("recommendations", [])
         if recommendations:
-            lines.append("🎯 General Recommendations:")
+            w("🎯 General Recommendations:\n")
             for i, rec in enumerate(recommendations, 1):
-                lines.append(f"  {i}. {rec}")
-            lines.append("")
+                w(f"  {i}. {rec}\n")
+            w("\n")
         
         # Missing categories
         missing_categories = insights.get("missing_categories", [])
         if missing_categories:
-            lines.append("📋 Missing Test Categories:")
+            w("📋 Missing Test Categories:\n")
             for category in missing_categories:
-                lines.append(f"  • {category}")
-            lines.append("")
+                w(f"  • {category}\n")
+            w("\n")
         
         # Individual test improvements
-        lines.append("🔧 Individual Test Case Improvements:")
-        lines.append("")
+        w("🔧 Individual Test Case Improvements:\n")
+        w("\n")
         
         for score_info in individual_scores:
             test_id = score_info.get("test_id", "")
@@ -1813,21 +2095,21 @@ Clarity: {clarity_score:.1f}/10  |  Completeness: {completeness_score:.1f}/10  |
             total_score = score_info.get("total_score", 0)
             
             if suggestions or weaknesses:
-                lines.append(f"📝 {test_id} (Score: {total_score:.1f}/10):")
+                w(f"📝 {test_id} (Score: {total_score:.1f}/10):\n")
                 
                 if weaknesses:
-                    lines.append("  Weaknesses:")
+                    w("  Weaknesses:\n")
                     for weakness in weaknesses:
-                        lines.append(f"    - {weakness}")
+                        w(f"    - {weakness}\n")
                 
                 if suggestions:
-                    lines.append("  Suggestions:")
+                    w("  Suggestions:\n")
                     for suggestion in suggestions:
-                        lines.append(f"    + {suggestion}")
+                        w(f"    + {suggestion}\n")
                 
-                lines.append("")
+                w("\n")
         
-        return "\n".join(lines)
+        return buf.getvalue()[:-1]  # no trailing newline, as with "\n".join
     
     def _generation_error(self, error_msg):
         """Handle generation error (called from main thread)."""
@@ -1837,24 +2119,40 @@ Clarity: {clarity_score:.1f}/10  |  Completeness: {completeness_score:.1f}/10  |
     def _stop_processing(self):
         """Stop processing indicators."""
         self.is_processing = False
-        self.generate_btn.config(state='normal')
+        self._set_states([(self.generate_btn, 'normal')])
         self.progress.stop()
         self.progress_label.config(text="")
     
+    def _set_states(self, pairs):
+        """Apply (widget, state) pairs, skipping widgets already in that state (no Tk call)."""
+        applied = self._widget_states
+        for widget, state in pairs:
+            if applied.get(widget) != state:
+                widget.config(state=state)
+                applied[widget] = state
+    
     def clear_test_cases(self):
         """Clear test cases display and quality metrics."""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        self.approve_btn.config(state='disabled')
-        self.reject_btn.config(state='disabled')
-        self.download_csv_btn.config(state='disabled')
-        self.download_xlsx_btn.config(state='disabled')
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self.quality_report = {}
+        self.quality_scores = {}
+        self.quality_details = {}
+        self._report_text_cache = {}
+        if self.approve_btn is None:
+            return  # results sections not built yet
         
         # Clear quality metrics
         self.quality_score_var.set("Click 'View Quality Report' after generating test cases")
         self.quality_dist_var.set("")
-        self.quality_btn.config(state='disabled')
-        self.quality_report = {}
+        self._set_states([
+            (self.approve_btn, 'disabled'),
+            (self.reject_btn, 'disabled'),
+            (self.download_csv_btn, 'disabled'),
+            (self.download_xlsx_btn, 'disabled'),
+            (self.quality_btn, 'disabled'),
+        ])
     
     def approve_and_push(self):
         """Approve test cases and push to TestRail."""
@@ -1880,30 +2178,30 @@ Clarity: {clarity_score:.1f}/10  |  Completeness: {completeness_score:.1f}/10  |
         
         if result:
             # Start push in background thread
-            self.approve_btn.config(state='disabled')
+            self._set_states([(self.approve_btn, 'disabled')])
             self.progress.start(10)
             
-            thread = threading.Thread(target=self._push_to_testrail_thread)
-            thread.daemon = True
-            thread.start()
+            self._executor.submit(self._push_to_testrail_thread)
     
     def _push_to_testrail_thread(self):
-        """Background thread for TestRail push."""
+        """Background thread for TestRail push (chunks of cases, concurrent requests per chunk)."""
         try:
             self.logger.info("📤 Pushing test cases to TestRail...")
             
+            cases = self.generated_cases
+            total = len(cases)
             created_ids = []
-            for case in self.generated_cases:
-                try:
-                    payload = map_case_to_testrail_payload(case)
-                    res = create_case(payload)
-                    cid = res.get("id")
-                    if cid:
-                        created_ids.append(cid)
-                        add_result(cid, status_id=3, comment="Created by Desktop UI")
-                        self.logger.info(f"✅ Created TestRail case: {case.get('title', '')}")
-                except Exception as e:
-                    self.logger.error(f"❌ Failed to create case '{case.get('title', '')}': {e}")
+            done = 0
+            # The pool size is also the cap on in-flight TestRail requests
+            with ThreadPoolExecutor(max_workers=TESTRAIL_PUSH_WORKERS) as ex:
+                for start in range(0, total, TESTRAIL_MAX_BATCH_SIZE):
+                    futures = [ex.submit(self._push_case, case) for case in cases[start:start + TESTRAIL_MAX_BATCH_SIZE]]
+                    for future in as_completed(futures):
+                        cid = future.result()
+                        if cid:
+                            created_ids.append(cid)
+                        done += 1
+                        self.root.after(0, self._update_push_progress, done, total)
             
             # Update UI
             self.root.after(0, self._push_complete, created_ids)
@@ -1912,9 +2210,28 @@ Clarity: {clarity_score:.1f}/10  |  Completeness: {completeness_score:.1f}/10  |
             self.logger.error(f"❌ TestRail push failed: {e}")
             self.root.after(0, self._push_error, str(e))
     
+    def _push_case(self, case):
+        """Create one case in TestRail and mark it untested; returns the case id or None."""
+        try:
+            payload = map_case_to_testrail_payload(case)
+            res = create_case(payload)
+            cid = res.get("id")
+            if cid:
+                add_result(cid, status_id=3, comment="Created by Desktop UI")
+                self.logger.info(f"✅ Created TestRail case: {case.get('title', '')}")
+            return cid
+        except Exception as e:
+            self.logger.error(f"❌ Failed to create case '{case.get('title', '')}': {e}")
+            return None
+    
+    def _update_push_progress(self, done, total):
+        """Show TestRail push progress (called from main thread)."""
+        self.progress_label.config(text=f"Pushed {done}/{total} to TestRail...")
+    
     def _push_complete(self, created_ids):
         """Handle successful TestRail push (called from main thread)."""
         self.progress.stop()
+        self.progress_label.config(text="")
         self.logger.info(f"🎉 Successfully pushed {len(created_ids)} test cases to TestRail!")
         
         # Show project stats
@@ -1933,7 +2250,8 @@ Clarity: {clarity_score:.1f}/10  |  Completeness: {completeness_score:.1f}/10  |
     def _push_error(self, error_msg):
         """Handle TestRail push error (called from main thread)."""
         self.progress.stop()
-        self.approve_btn.config(state='normal')
+        self.progress_label.config(text="")
+        self._set_states([(self.approve_btn, 'normal')])
         messagebox.showerror("TestRail Error", f"Failed to push to TestRail:\n{error_msg}")
     
     def reject_cases(self):
@@ -1947,41 +2265,32 @@ Clarity: {clarity_score:.1f}/10  |  Completeness: {completeness_score:.1f}/10  |
         if result:
             self.clear_test_cases()
             self.generated_cases = []
+            self._case_columns = _project_cases([])
             self.logger.info("🚫 Test cases rejected by user")
     
     def download_csv(self):
         """Download test cases as CSV file."""
+        if self.is_processing:
+            return
+        
         if not self.generated_cases:
             messagebox.showwarning("No Data", "No test cases available to download.")
             return
         
-        # Ask user for save location
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        default_filename = f"test_cases_{timestamp}.csv"
-        
-        file_path = filedialog.asksaveasfilename(
-            title="Save Test Cases as CSV",
-            defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-            initialfile=default_filename
-        )
-        
+        file_path = self._prompt_save_path("csv", "CSV")
         if not file_path:
             return
         
-        try:
-            self._export_to_csv(file_path)
-            self.logger.info(f"📄 Test cases exported to CSV: {file_path}")
-            messagebox.showinfo("Export Success", f"Test cases successfully exported to:\n{file_path}")
-        except Exception as e:
-            self.logger.error(f"❌ CSV export failed: {e}")
-            messagebox.showerror("Export Error", f"Failed to export CSV:\n{e}")
+        self._start_export(self._export_to_csv, file_path, "CSV", "📄")
     
     def download_xlsx(self):
         """Download test cases as Excel file."""
+        if self.is_processing:
+            return
+        
         if not EXCEL_AVAILABLE:
             messagebox.showerror("Excel Not Available", 
-                               "Excel export requires openpyxl library.\n"
+                               "Excel export requires the openpyxl or xlsxwriter library.\n"
                                "Install it with: pip install openpyxl")
             return
         
@@ -1989,220 +2298,244 @@ Clarity: {clarity_score:.1f}/10  |  Completeness: {completeness_score:.1f}/10  |
             messagebox.showwarning("No Data", "No test cases available to download.")
             return
         
-        # Ask user for save location
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        default_filename = f"test_cases_{timestamp}.xlsx"
-        
-        file_path = filedialog.asksaveasfilename(
-            title="Save Test Cases as Excel",
-            defaultextension=".xlsx",
-            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")],
-            initialfile=default_filename
-        )
-        
+        file_path = self._prompt_save_path("xlsx", "Excel")
         if not file_path:
             return
         
+        self._start_export(self._export_to_excel, file_path, "Excel", "📊")
+    
+    def _prompt_save_path(self, ext, kind):
+        """Ask the user where to save the export; returns "" when cancelled."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return filedialog.asksaveasfilename(
+            title=f"Save Test Cases as {kind}",
+            defaultextension=f".{ext}",
+            filetypes=[(f"{kind} files", f"*.{ext}"), ("All files", "*.*")],
+            initialfile=f"test_cases_{timestamp}.{ext}"
+        )
+    
+    def _start_export(self, export, file_path, kind, icon):
+        """Run `export(file_path)` in a background thread so the window keeps responding."""
+        self.is_processing = True
+        self._set_states([(self.download_csv_btn, 'disabled'), (self.download_xlsx_btn, 'disabled')])
+        self.progress.start(10)
+        self.progress_label.config(text=f"Exporting {kind}...")
+        
+        self._executor.submit(self._export_thread, export, file_path, kind, icon)
+    
+    def _export_thread(self, export, file_path, kind, icon):
+        """Background thread for CSV/Excel export."""
         try:
-            self._export_to_excel(file_path)
-            self.logger.info(f"📊 Test cases exported to Excel: {file_path}")
-            messagebox.showinfo("Export Success", f"Test cases successfully exported to:\n{file_path}")
+            export(file_path)
+            self.logger.info(f"{icon} Test cases exported to {kind}: {file_path}")
+            self.root.after(0, self._export_done, file_path)
         except Exception as e:
-            self.logger.error(f"❌ Excel export failed: {e}")
-            messagebox.showerror("Export Error", f"Failed to export Excel:\n{e}")
+            self.logger.error(f"❌ {kind} export failed: {e}")
+            self.root.after(0, self._export_error, kind, str(e))
+    
+    def _export_done(self, file_path):
+        """Handle export completion (called from main thread)."""
+        self._stop_export()
+        messagebox.showinfo("Export Success", f"Test cases successfully exported to:\n{file_path}")
+    
+    def _export_error(self, kind, error_msg):
+        """Handle export error (called from main thread)."""
+        self._stop_export()
+        messagebox.showerror("Export Error", f"Failed to export {kind}:\n{error_msg}")
+    
+    def _stop_export(self):
+        """Stop export processing indicators."""
+        self.is_processing = False
+        self._set_states([
+            (self.download_csv_btn, 'normal'),
+            (self.download_xlsx_btn, 'normal' if EXCEL_AVAILABLE else 'disabled'),
+        ])
+        self.progress.stop()
+        self.progress_label.config(text="")
     
     def _export_to_csv(self, file_path):
-        """Export test cases to CSV format."""
-        # Debug: Log quality report status
-        self.logger.info(f"🔍 CSV Export Debug - Quality report available: {bool(self.quality_report)}")
-        if self.quality_report:
-            individual_scores = self.quality_report.get("individual_scores", [])
-            self.logger.info(f"🔍 Individual scores count: {len(individual_scores)}")
+        """Export test cases to CSV format (rows encoded into a buffer that is flushed every CSV_FLUSH_BYTES)."""
+        # Debug: Log quality report status (one line per export, nothing per row)
+        self.logger.debug("🔍 CSV Export Debug - Quality report available: %s, %d scored cases",
+                          bool(self.quality_report), len(self.quality_scores))
+        
+        t0 = time.perf_counter()
+        buf = bytearray(CSV_HEADER)
+        buf_extend = buf.extend
+        needs_quoting = _CSV_NEEDS_QUOTING
+        written = 0
+        
+        def write_row(*fields):
+            # Same quoting as csv.writer (QUOTE_MINIMAL, \r\n line endings)
+            for i, field in enumerate(fields):
+                if i:
+                    buf_extend(b",")
+                if needs_quoting(field):
+                    buf_extend(b'"' + field.replace('"', '""').encode("utf-8") + b'"')
+                else:
+                    buf_extend(field.encode("utf-8"))
+            buf_extend(b"\r\n")
         
-        with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['Test ID', 'Title', 'Steps', 'Expected Result', 'Priority', 'Quality Score']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            # Write header
-            writer.writeheader()
-            
-            # Create quality score mapping
-            quality_scores = {}
-            if self.quality_report and "individual_scores" in self.quality_report:
-                for score_info in self.quality_report["individual_scores"]:
-                    test_id = score_info.get("test_id", "")
-                    total_score = score_info.get("total_score", 0)
-                    quality_scores[test_id] = total_score
-                    self.logger.info(f"🔍 CSV Score mapping: {test_id} → {total_score:.1f}/10")
-            
+        def cell(value):
+            # DictWriter writes None as an empty field
+            return "" if value is None else str(value)
+        
+        with open(file_path, "wb") as f:
             # Write test cases
-            for case in self.generated_cases:
-                steps = case.get("steps", [])
-                if isinstance(steps, list):
-                    steps_text = "\n".join(f"{i+1}. {step}" for i, step in enumerate(steps))
-                else:
-                    steps_text = str(steps)
-                
-                test_id = case.get("id", "")
-                quality_score = quality_scores.get(test_id, 0)
-                quality_display = f"{quality_score:.1f}/10" if quality_score > 0 else "N/A"
-                
-                writer.writerow({
-                    'Test ID': test_id,
-                    'Title': case.get("title", ""),
-                    'Steps': steps_text,
-                    'Expected Result': case.get("expected", ""),
-                    'Priority': case.get("priority", "Medium"),
-                    'Quality Score': quality_display
-                })
-            
-            # Add metadata at the end
-            writer.writerow({})  # Empty row
-            writer.writerow({'Test ID': '--- METADATA ---'})
-            writer.writerow({'Test ID': 'Generated On', 'Title': datetime.now().strftime("%Y-%m-%d %H:%M:%S")})
-            writer.writerow({'Test ID': 'Total Test Cases', 'Title': str(len(self.generated_cases))})
+            for test_id, title, steps_text, expected, priority, _, quality_display in self._export_rows(self.quality_scores):
+                write_row(cell(test_id), cell(title), steps_text, cell(expected), cell(priority), quality_display)
+                if len(buf) >= CSV_FLUSH_BYTES:
+                    f.write(buf)
+                    written += len(buf)
+                    del buf[:]
+            
+            # Add metadata at the end (short rows padded to the header width like DictWriter)
+            buf_extend(b",,,,,\r\n")  # Empty row
+            write_row('--- METADATA ---', "", "", "", "", "")
+            write_row('Generated On', datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "", "", "", "")
+            write_row('Total Test Cases', str(len(self.generated_cases)), "", "", "", "")
             
             if self.quality_report:
                 overall_score = self.quality_report.get("overall_score", 0)
-                writer.writerow({'Test ID': 'Overall Quality Score', 'Title': f"{overall_score:.1f}/10"})
+                write_row('Overall Quality Score', f"{overall_score:.1f}/10", "", "", "", "")
+            
+            f.write(buf)
+            written += len(buf)
+        
+        self.logger.info(f"📄 CSV written: {written} bytes in {(time.perf_counter() - t0) * 1000:.1f} ms")
     
     def _export_to_excel(self, file_path):
         """Export test cases to Excel format with formatting."""
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-        
-        # Debug: Log quality report status
-        self.logger.info(f"🔍 Excel Export Debug - Quality report available: {bool(self.quality_report)}")
-        if self.quality_report:
-            individual_scores = self.quality_report.get("individual_scores", [])
-            self.logger.info(f"🔍 Individual scores count: {len(individual_scores)}")
-            for score_info in individual_scores:
-                test_id = score_info.get("test_id", "Unknown")
-                total_score = score_info.get("total_score", 0)
-                self.logger.info(f"🔍 Score mapping: {test_id} → {total_score:.1f}/10")
-        
-        wb = Workbook()
-        
-        # Test Cases Sheet
-        ws_cases = wb.active
-        ws_cases.title = "Test Cases"
-        
-        # Headers
-        headers = ['Test ID', 'Title', 'Steps', 'Expected Result', 'Priority', 'Quality Score']
-        for col, header in enumerate(headers, 1):
-            cell = ws_cases.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-            cell.border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-        
-        # Create quality score mapping
-        quality_scores = {}
-        quality_details = {}
-        if self.quality_report and "individual_scores" in self.quality_report:
-            for score_info in self.quality_report["individual_scores"]:
-                test_id = score_info.get("test_id", "")
-                total_score = score_info.get("total_score", 0)
-                scores = score_info.get("scores", {})
-                quality_scores[test_id] = total_score
-                quality_details[test_id] = scores
-        
-        # Data rows
-        for row, case in enumerate(self.generated_cases, 2):
-            steps = case.get("steps", [])
-            if isinstance(steps, list):
-                steps_text = "\n".join(f"{i+1}. {step}" for i, step in enumerate(steps))
-            else:
-                steps_text = str(steps)
-            
-            test_id = case.get("id", "")
-            quality_score = quality_scores.get(test_id, 0)
-            quality_display = f"{quality_score:.1f}/10" if quality_score > 0 else "N/A"
-            
-            # Debug: Log each quality score mapping
-            self.logger.info(f"🔍 Excel row {row}: {test_id} → score={quality_score}, display='{quality_display}'")
-            
-            # Add data
-            ws_cases.cell(row=row, column=1, value=test_id)
-            ws_cases.cell(row=row, column=2, value=case.get("title", ""))
-            
-            steps_cell = ws_cases.cell(row=row, column=3, value=steps_text)
-            steps_cell.alignment = Alignment(wrap_text=True, vertical="top")
-            
-            ws_cases.cell(row=row, column=4, value=case.get("expected", ""))
-            
-            priority_cell = ws_cases.cell(row=row, column=5, value=case.get("priority", "Medium"))
-            
-            quality_cell = ws_cases.cell(row=row, column=6, value=quality_display)
-            self.logger.info(f"🔍 Set Excel cell F{row} = '{quality_display}'")
-            
-            # Color code quality scores
-            if quality_score >= 8.0:
-                quality_cell.fill = PatternFill(start_color="90EE90", end_color="90EE90", fill_type="solid")
-            elif quality_score >= 6.0:
-                quality_cell.fill = PatternFill(start_color="FFE135", end_color="FFE135", fill_type="solid")
-            elif quality_score > 0:
-                quality_cell.fill = PatternFill(start_color="FFB6C1", end_color="FFB6C1", fill_type="solid")
-            
-            # Color code priority
-            if case.get("priority", "").lower() == "high":
-                priority_cell.fill = PatternFill(start_color="FFB6C1", end_color="FFB6C1", fill_type="solid")
-            elif case.get("priority", "").lower() == "low":
-                priority_cell.fill = PatternFill(start_color="D3D3D3", end_color="D3D3D3", fill_type="solid")
+        if len(self.generated_cases) > EXCEL_FAST_EXPORT_ROWS:
+            self._export_to_excel_fast(file_path)
+        elif XLSXWRITER_AVAILABLE:
+            self._export_to_excel_xlsxwriter(file_path)
+        else:
+            self._export_to_excel_openpyxl(file_path)
+    
+    def _export_to_excel_fast(self, file_path):
+        """Export test cases to Excel by streaming the sheet XML into the zip (large exports).
+        
+        Same sheets, fills and fonts as the library exporters; the header rows have no border.
+        """
+        self.logger.debug("🔍 Excel Export Debug - Quality report available: %s", bool(self.quality_report))
+        
+        # Quality score mappings (built once when the report arrived)
+        quality_scores = self.quality_scores
+        quality_details = self.quality_details
+        
+        def case_rows():
+            for test_id, title, steps_text, expected, priority, quality_score, quality_display in self._export_rows(quality_scores):
+                yield (
+                    test_id,
+                    title,
+                    steps_text,
+                    expected,
+                    (priority, FILL_STYLES.get(_EXCEL_PRIORITY_FILLS.get(priority.lower()), STYLE_DEFAULT)),
+                    (quality_display, FILL_STYLES.get(_quality_fill_color(quality_score), STYLE_DEFAULT)),
+                )
+        
+        def detail_rows():
+            for test_id, (scores, total_score) in quality_details.items():
+                yield (
+                    test_id,
+                    f"{scores.get('clarity', 0):.1f}",
+                    f"{scores.get('completeness', 0):.1f}",
+                    f"{scores.get('specificity', 0):.1f}",
+                    f"{scores.get('testability', 0):.1f}",
+                    f"{scores.get('coverage', 0):.1f}",
+                    (f"{total_score:.1f}", FILL_STYLES.get(_quality_fill_color(total_score), STYLE_DEFAULT)),
+                )
+        
+        def summary_rows():
+            for label, value in self._excel_summary_rows(quality_scores):
+                if label in ["Test Case Export Summary", "Quality Assessment", "Quality Distribution"]:
+                    label = (label, STYLE_SECTION)
+                elif label:
+                    label = (label, STYLE_BOLD)
+                else:
+                    label = None  # Empty spacer row
+                yield (label, None if value == "" else value)
         
-        # Adjust column widths
-        ws_cases.column_dimensions['A'].width = 12  # Test ID
-        ws_cases.column_dimensions['B'].width = 30  # Title
-        ws_cases.column_dimensions['C'].width = 50  # Steps
-        ws_cases.column_dimensions['D'].width = 30  # Expected
-        ws_cases.column_dimensions['E'].width = 10  # Priority
-        ws_cases.column_dimensions['F'].width = 15  # Quality
+        sheets = [XlsxSheet("Test Cases", CASE_HEADERS,
+                            case_rows(), EXCEL_CASE_COLUMN_WIDTHS, {2: STYLE_WRAP})]
+        if quality_details:
+            sheets.append(XlsxSheet("Quality Details",
+                                    QUALITY_HEADERS,
+                                    detail_rows(), (12,) * 7, header_style=STYLE_DETAILS_HEADER))
+        sheets.append(XlsxSheet("Summary", (), summary_rows(), (25, 20)))
+        
+        t0 = time.perf_counter()
+        write_xlsx_sheets(file_path, sheets, compresslevel=3)
+        self.logger.info(f"📊 Excel written directly: {len(self.generated_cases)} rows in {(time.perf_counter() - t0) * 1000:.1f} ms")
+    
+    def _export_to_excel_xlsxwriter(self, file_path):
+        """Export test cases to Excel with xlsxwriter (same sheets and colours, rows streamed)."""
+        self.logger.debug("🔍 Excel Export Debug - Quality report available: %s", bool(self.quality_report))
+        
+        # Quality score mappings (built once when the report arrived)
+        quality_scores = self.quality_scores
+        quality_details = self.quality_details
+        
+        wb = xlsxwriter.Workbook(str(file_path), {"constant_memory": True})
+        header_fmt = wb.add_format({
+            "bold": True, "font_color": "#FFFFFF", "bg_color": "#366092",
+            "align": "center", "valign": "vcenter", "border": 1,
+        })
+        details_header_fmt = wb.add_format({
+            "bold": True, "font_color": "#FFFFFF", "bg_color": "#4F81BD",
+            "align": "center", "valign": "vcenter",
+        })
+        wrap_fmt = wb.add_format({"text_wrap": True, "valign": "top"})
+        fill_fmts = {color: wb.add_format({"bg_color": f"#{color}"})
+                     for color in ("90EE90", "FFE135", "FFB6C1", "D3D3D3")}
+        
+        # Test Cases Sheet (column widths must be set before rows in constant_memory mode)
+        ws_cases = wb.add_worksheet("Test Cases")
+        for col, width in enumerate(EXCEL_CASE_COLUMN_WIDTHS):
+            ws_cases.set_column(col, col, width)
+        ws_cases.write_row(0, 0, CASE_HEADERS, header_fmt)
+        
+        for row, (test_id, title, steps_text, expected, priority, quality_score, quality_display) in enumerate(self._export_rows(quality_scores), 1):
+            priority_fmt = fill_fmts.get(_EXCEL_PRIORITY_FILLS.get(priority.lower()))
+            
+            ws_cases.write(row, 0, test_id)
+            ws_cases.write(row, 1, title)
+            ws_cases.write(row, 2, steps_text, wrap_fmt)
+            ws_cases.write(row, 3, expected)
+            ws_cases.write(row, 4, priority, priority_fmt)
+            ws_cases.write(row, 5, quality_display, fill_fmts.get(_quality_fill_color(quality_score)))
         
         # Quality Details Sheet
         if quality_details:
-            ws_quality = wb.create_sheet("Quality Details")
-            
-            # Headers for quality details
-            quality_headers = ['Test ID', 'Clarity', 'Completeness', 'Specificity', 'Testability', 'Coverage', 'Total Score']
-            for col, header in enumerate(quality_headers, 1):
-                cell = ws_quality.cell(row=1, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-            
-            # Quality data
-            for row, (test_id, scores) in enumerate(quality_details.items(), 2):
-                ws_quality.cell(row=row, column=1, value=test_id)
-                ws_quality.cell(row=row, column=2, value=f"{scores.get('clarity', 0):.1f}")
-                ws_quality.cell(row=row, column=3, value=f"{scores.get('completeness', 0):.1f}")
-                ws_quality.cell(row=row, column=4, value=f"{scores.get('specificity', 0):.1f}")
-                ws_quality.cell(row=row, column=5, value=f"{scores.get('testability', 0):.1f}")
-                ws_quality.cell(row=row, column=6, value=f"{scores.get('coverage', 0):.1f}")
-                
-                total_score = quality_scores.get(test_id, 0)
-                total_cell = ws_quality.cell(row=row, column=7, value=f"{total_score:.1f}")
-                
-                # Color code total score
-                if total_score >= 8.0:
-                    total_cell.fill = PatternFill(start_color="90EE90", end_color="90EE90", fill_type="solid")
-                elif total_score >= 6.0:
-                    total_cell.fill = PatternFill(start_color="FFE135", end_color="FFE135", fill_type="solid")
-                elif total_score > 0:
-                    total_cell.fill = PatternFill(start_color="FFB6C1", end_color="FFB6C1", fill_type="solid")
-            
-            # Adjust column widths
-            for col in range(1, 8):
-                ws_quality.column_dimensions[chr(64 + col)].width = 12
+            ws_quality = wb.add_worksheet("Quality Details")
+            ws_quality.set_column(0, 6, 12)
+            ws_quality.write_row(0, 0, QUALITY_HEADERS, details_header_fmt)
+            for row, (test_id, (scores, total_score)) in enumerate(quality_details.items(), 1):
+                ws_quality.write_row(row, 0, [test_id] + [
+                    f"{scores.get(key, 0):.1f}"
+                    for key in ('clarity', 'completeness', 'specificity', 'testability', 'coverage')
+                ])
+                ws_quality.write(row, 6, f"{total_score:.1f}", fill_fmts.get(_quality_fill_color(total_score)))
         
         # Summary Sheet
-        ws_summary = wb.create_sheet("Summary")
+        ws_summary = wb.add_worksheet("Summary")
+        ws_summary.set_column(0, 0, 25)
+        ws_summary.set_column(1, 1, 20)
+        section_fmt = wb.add_format({"bold": True, "font_size": 12})
+        label_fmt = wb.add_format({"bold": True})
+        for row, (label, value) in enumerate(self._excel_summary_rows(quality_scores)):
+            if label in ["Test Case Export Summary", "Quality Assessment", "Quality Distribution"]:
+                ws_summary.write(row, 0, label, section_fmt)
+            elif label:
+                ws_summary.write(row, 0, label, label_fmt)
+            if value != "":
+                ws_summary.write(row, 1, value)
         
-        # Summary content
+        wb.close()
+    
+    def _excel_summary_rows(self, quality_scores):
+        """(label, value) rows for the Summary sheet of the Excel export."""
         summary_data = [
             ["Test Case Export Summary", ""],
             ["Generated On", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
@@ -2221,58 +2554,239 @@ Clarity: {clarity_score:.1f}/10  |  Completeness: {completeness_score:.1f}/10  |
             
             # Quality distribution
             if quality_scores:
-                high_quality = sum(1 for score in quality_scores.values() if score >= 8.0)
-                medium_quality = sum(1 for score in quality_scores.values() if 6.0 <= score < 8.0)
-                low_quality = sum(1 for score in quality_scores.values() if score < 6.0)
+                # One pass: counts indexed like _QUALITY_COLORS (low, medium, high)
+                counts = [0, 0, 0]
+                for score in quality_scores.values():
+                    counts[bisect_right(_QUALITY_COLOR_BINS, score)] += 1
+                low_quality, medium_quality, high_quality = counts
                 
                 summary_data.extend([
                     ["High Quality (8.0+)", high_quality],
                     ["Medium Quality (6.0-7.9)", medium_quality],
                     ["Low Quality (<6.0)", low_quality],
                 ])
+        return summary_data
+    
+    def _export_to_excel_openpyxl(self, file_path):
+        """Export test cases to Excel with openpyxl (fallback when xlsxwriter is missing).
         
-        # Write summary data
-        for row, (label, value) in enumerate(summary_data, 1):
-            label_cell = ws_summary.cell(row=row, column=1, value=label)
-            value_cell = ws_summary.cell(row=row, column=2, value=value)
+        Uses a write-only workbook: rows are streamed to the file as they are appended, and
+        column widths are set before the first row of each sheet.
+        """
+        # Debug: Log quality report status
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("🔍 Excel Export Debug - Quality report available: %s", bool(self.quality_report))
+        if debug and self.quality_report:
+            individual_scores = self.quality_report.get("individual_scores", [])
+            self.logger.debug("🔍 Individual scores count: %d", len(individual_scores))
+            for score_info in individual_scores:
+                self.logger.debug("🔍 Score mapping: %s → %.1f/10", score_info.get("test_id", "Unknown"), score_info.get("total_score", 0))
+        
+        wb = Workbook(write_only=True)
+        
+        def styled(ws, value, **styles):
+            cell = WriteOnlyCell(ws, value=value)
+            for name, style in styles.items():
+                setattr(cell, name, style)
+            return cell
+        
+        def header_row(ws, headers, fill, **styles):
+            return [styled(ws, header, font=_XLSX_HEADER_FONT, fill=fill, alignment=_XLSX_HEADER_ALIGN, **styles)
+                    for header in headers]
+        
+        # Test Cases Sheet
+        ws_cases = wb.create_sheet("Test Cases")
+        
+        # Adjust column widths
+        for letter, width in zip("ABCDEF", EXCEL_CASE_COLUMN_WIDTHS):
+            ws_cases.column_dimensions[letter].width = width
+        
+        # Headers
+        ws_cases.append(header_row(ws_cases, CASE_HEADERS, _XLSX_HEADER_FILL, border=_XLSX_THIN_BORDER))
+        
+        # Quality score mappings (built once when the report arrived)
+        quality_scores = self.quality_scores
+        quality_details = self.quality_details
+        
+        # Data rows
+        for row, (test_id, title, steps_text, expected, priority, quality_score, quality_display) in enumerate(self._export_rows(quality_scores), 2):
+            # Debug: Log each quality score mapping
+            if debug:
+                self.logger.debug("🔍 Excel row %d: %s → score=%s, display='%s'", row, test_id, quality_score, quality_display)
             
-            if label in ["Test Case Export Summary", "Quality Assessment", "Quality Distribution"]:
-                label_cell.font = Font(bold=True, size=12)
-            elif label == "":
-                continue  # Skip empty rows
-            else:
-                label_cell.font = Font(bold=True)
+            # Color code quality scores
+            quality_cell = styled(ws_cases, quality_display)
+            fill = _XLSX_FILLS.get(_quality_fill_color(quality_score))
+            if fill is not None:
+                quality_cell.fill = fill
+            
+            # Color code priority
+            priority_cell = styled(ws_cases, priority)
+            fill = _XLSX_FILLS.get(_EXCEL_PRIORITY_FILLS.get(priority.lower()))
+            if fill is not None:
+                priority_cell.fill = fill
+            
+            ws_cases.append([
+                test_id,
+                title,
+                styled(ws_cases, steps_text, alignment=_XLSX_WRAP_TOP),
+                expected,
+                priority_cell,
+                quality_cell,
+            ])
+            if debug:
+                self.logger.debug("🔍 Set Excel cell F%d = '%s'", row, quality_display)
+        
+        # Quality Details Sheet
+        if quality_details:
+            ws_quality = wb.create_sheet("Quality Details")
+            
+            # Adjust column widths
+            for letter in "ABCDEFG":
+                ws_quality.column_dimensions[letter].width = 12
+            
+            # Headers for quality details
+            ws_quality.append(header_row(ws_quality, QUALITY_HEADERS, _XLSX_DETAILS_HEADER_FILL))
+            
+            # Quality data
+            for test_id, (scores, total_score) in quality_details.items():
+                total_cell = styled(ws_quality, f"{total_score:.1f}")
+                fill = _XLSX_FILLS.get(_quality_fill_color(total_score))
+                if fill is not None:
+                    total_cell.fill = fill
+                
+                ws_quality.append([
+                    test_id,
+                    f"{scores.get('clarity', 0):.1f}",
+                    f"{scores.get('completeness', 0):.1f}",
+                    f"{scores.get('specificity', 0):.1f}",
+                    f"{scores.get('testability', 0):.1f}",
+                    f"{scores.get('coverage', 0):.1f}",
+                    total_cell,
+                ])
+        
+        # Summary Sheet
+        ws_summary = wb.create_sheet("Summary")
         
         # Adjust summary column widths
         ws_summary.column_dimensions['A'].width = 25
         ws_summary.column_dimensions['B'].width = 20
         
+        # Write summary data
+        for label, value in self._excel_summary_rows(quality_scores):
+            if label in ["Test Case Export Summary", "Quality Assessment", "Quality Distribution"]:
+                label_cell = styled(ws_summary, label, font=_XLSX_SECTION_FONT)
+            elif label == "":
+                label_cell = label  # Empty spacer row
+            else:
+                label_cell = styled(ws_summary, label, font=_XLSX_LABEL_FONT)
+            ws_summary.append([label_cell, value])
+        
         # Save workbook
         wb.save(file_path)
+    
+    def shutdown(self):
+        """Stop the background pool on exit: queued jobs are dropped, running ones are not waited for."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _CaseStreamParser:
+    """Incremental scanner for a streamed JSON array of case objects.
+    
+    `feed` returns the case dicts whose objects closed in that chunk. Only the
+    top-level array's direct children are reported, and text before the first
+    `[` (e.g. a code fence) is skipped. The full text is kept in `raw`.
+    """
+    
+    def __init__(self):
+        self.raw = io.StringIO()
+        self._depth = 0
+        self._in_str = False
+        self._escape = False
+        self._in_obj = False
+        self._obj_parts = []
+    
+    def feed(self, chunk):
+        self.raw.write(chunk)
+        cases = []
+        start = 0 if self._in_obj else None
+        for i, ch in enumerate(chunk):
+            if self._in_str:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_str = False
+            elif ch == '"':
+                self._in_str = self._depth > 0
+            elif ch in "[{":
+                self._depth += 1
+                if ch == "{" and self._depth == 2:
+                    self._in_obj = True
+                    start = i
+            elif ch in "]}" and self._depth:
+                self._depth -= 1
+                if ch == "}" and self._in_obj and self._depth == 1:
+                    self._obj_parts.append(chunk[start:i + 1])
+                    text = "".join(self._obj_parts)
+                    self._obj_parts = []
+                    self._in_obj = False
+                    start = None
+                    try:
+                        case = json.loads(text)
+                    except ValueError:
+                        continue
+                    if isinstance(case, dict):
+                        cases.append(case)
+        if start is not None:
+            self._obj_parts.append(chunk[start:])
+        return cases
+
+
+class _TextPeer(tk.Text):
+    """Text widget created with `peer_create`, sharing `source`'s text buffer."""
+    
+    def __init__(self, master, source, **kw):
+        tk.BaseWidget._setup(self, master, {})
+        source.peer_create(self._w, **kw)
 
 
 class LogHandler(logging.Handler):
-    """Custom logging handler to display logs in the UI."""
+    """Custom logging handler to display logs in the UI (last LOG_MAX_LINES lines)."""
+    
+    LOG_MAX_LINES = 2000
+    # Redraw cadence: records arriving within this window share one redraw (~10 Hz)
+    LOG_FLUSH_MS = 100
     
     def __init__(self, app):
         super().__init__()
         self.app = app
+        self._ring = collections.deque(maxlen=self.LOG_MAX_LINES)
+        self._log_pending = False
     
     def emit(self, record):
-        """Display log message in the UI."""
+        """Queue log message for the UI; records within LOG_FLUSH_MS collapse into one redraw."""
         try:
-            msg = self.format(record)
-            # Schedule UI update in main thread
-            self.app.root.after(0, self._update_log, msg)
+            self._ring.append(self.format(record))
+            if not self._log_pending:
+                self._log_pending = True
+                # Schedule UI update in main thread
+                self.app.root.after(self.LOG_FLUSH_MS, self._flush_log)
         except Exception:
             pass  # Ignore logging errors
     
-    def _update_log(self, message):
-        """Update log display (called from main thread)."""
+    def _flush_log(self):
+        """Redraw the log from the ring buffer (called from main thread)."""
+        self._log_pending = False
         try:
-            if hasattr(self.app, 'log_text'):
-                self.app.log_text.insert(tk.END, message + "\n")
-                self.app.log_text.see(tk.END)  # Auto-scroll to bottom
+            log_text = getattr(self.app, 'log_text', None)
+            # Leave the text alone while the user is scrolled up reading history
+            if log_text is not None and log_text.yview()[1] >= 1.0:
+                log_text.delete('1.0', tk.END)
+                log_text.insert(tk.END, "\n".join(self._ring) + "\n")
+                log_text.see(tk.END)  # Auto-scroll to bottom
         except Exception:
             pass
 
@@ -2281,18 +2795,27 @@ def main():
     """Main entry point for the desktop application."""
     root = tk.Tk()
     
-    # Apply modern theme for better UI appearance
-    try:
-        sv_ttk.set_theme("light")  # Use modern light theme
-        print("✨ Applied modern theme successfully")
-    except Exception as e:
-        print(f"⚠️  Could not apply modern theme: {e}")
-    
     app = TestCaseGeneratorApp(root)
     
+    # Load the modern theme once the window is up instead of before it is built.
+    # The app selects 'clam' in __init__ and configures its styles on it, so that
+    # theme is selected again afterwards (same final look as loading it first).
+    def load_theme():
+        style = ttk.Style(root)
+        app_theme = style.theme_use()
+        try:
+            sv_ttk.set_theme("light")  # Use modern light theme
+            style.theme_use(app_theme)
+            print("✨ Applied modern theme successfully")
+        except Exception as e:
+            print(f"⚠️  Could not apply modern theme: {e}")
+    
+    root.after_idle(load_theme)
+    
     # Handle window closing
     def on_closing():
-        if messagebox.askokcancel("Quit", "Do you want to quit the TestCase Generator?"):
+        if NO_CONFIRM_QUIT or messagebox.askokcancel("Quit", "Do you want to quit the TestCase Generator?"):
+            app.shutdown()
             root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)